@@ -36,6 +36,7 @@ html_theme_options = {
 autosummary_generate = True
 autodoc_member_order = "groupwise"
 autoclass_content = "class"
+autodoc_typehints = "none"
 
 # sphinxcontrib-pydantic (all options enabled for demonstration)
 sphinxcontrib_pydantic_model_show_json = True
@@ -57,40 +58,10 @@ numpydoc_class_members_toctree = False
 numpydoc_attributes_as_param_list = False
 numpydoc_xref_param_type = True
 
-# Disable inherited class members for Pydantic models to avoid broken cross-references
-# to inherited BaseModel methods (model_dump, model_validate, etc.)
-numpydoc_show_inherited_class_members = {
-    # models.base
-    "example_advanced.models.base.BaseEntity": False,
-    "example_advanced.models.base.NamedEntity": False,
-    "example_advanced.models.base.AuditableEntity": False,
-    # models.config
-    "example_advanced.models.config.DatabaseConfig": False,
-    "example_advanced.models.config.CacheConfig": False,
-    "example_advanced.models.config.AppConfig": False,
-    # models.validators
-    "example_advanced.models.validators.PasswordReset": False,
-    "example_advanced.models.validators.DataProcessor": False,
-    "example_advanced.models.validators.BoundedValue": False,
-    # models.computed
-    "example_advanced.models.computed.Rectangle": False,
-    "example_advanced.models.computed.Person": False,
-    # generics
-    "example_advanced.generics.Response": False,
-    "example_advanced.generics.PaginatedResponse": False,
-    "example_advanced.generics.KeyValueStore": False,
-    # settings
-    "example_advanced.settings.AppSettings": False,
-    "example_advanced.settings.DatabaseSettings": False,
-    # database.dto
-    "example_advanced.database.dto.ProjectBase": False,
-    "example_advanced.database.dto.ProjectCreate": False,
-    "example_advanced.database.dto.ProjectRead": False,
-    "example_advanced.database.dto.ProjectUpdate": False,
-    # database.table
-    "example_advanced.database.table.User": False,
-    "example_advanced.database.table.Project": False,
-}
+# Disable inherited class members for every class to avoid broken cross-references
+# to inherited BaseModel methods (model_dump, model_validate, etc.). All classes of
+# example_advanced are Pydantic models, so a global switch replaces a per-class dict.
+numpydoc_show_inherited_class_members = False
 
 # Intersphinx
 intersphinx_mapping = get_intersphinx_mapping(packages={"python", "sqlalchemy"})
@@ -3,7 +3,7 @@
 REM Minimal makefile for Sphinx documentation
 
 REM Set default options and commands
-set SPHINXOPTS=-nWT --keep-going
+set SPHINXOPTS=-nWT --keep-going -j auto
 set SPHINXBUILD=sphinx-build
 
 if "%1" == "html" goto html
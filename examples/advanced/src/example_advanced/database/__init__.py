@@ -1,12 +1,22 @@
-"""SQLModel database models."""
+"""SQLModel database models.
 
-from example_advanced.database.dto import (
-    ProjectBase,
-    ProjectCreate,
-    ProjectRead,
-    ProjectUpdate,
-)
-from example_advanced.database.table import Project, User
+Submodules are imported lazily on first attribute access (PEP 562), so importing a
+single submodule does not pay for the SQLAlchemy table registration of the others.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from example_advanced.database.dto import (
+        ProjectBase,
+        ProjectCreate,
+        ProjectRead,
+        ProjectUpdate,
+    )
+    from example_advanced.database.table import Project, User
 
 __all__ = [
     "Project",
@@ -16,3 +26,24 @@ __all__ = [
     "ProjectUpdate",
     "User",
 ]
+
+_LAZY: dict[str, str] = {
+    "Project": "example_advanced.database.table",
+    "ProjectBase": "example_advanced.database.dto",
+    "ProjectCreate": "example_advanced.database.dto",
+    "ProjectRead": "example_advanced.database.dto",
+    "ProjectUpdate": "example_advanced.database.dto",
+    "User": "example_advanced.database.table",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,23 @@
-"""Pydantic model examples."""
+"""Pydantic model examples.
 
-from example_advanced.models.base import AuditableEntity, BaseEntity, NamedEntity
-from example_advanced.models.computed import Person, Rectangle
-from example_advanced.models.config import AppConfig, CacheConfig, DatabaseConfig
-from example_advanced.models.validators import (
-    BoundedValue,
-    DataProcessor,
-    PasswordReset,
-)
+Submodules are imported lazily on first attribute access (PEP 562), so importing a
+single submodule does not build the schemas of the others.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from example_advanced.models.base import AuditableEntity, BaseEntity, NamedEntity
+    from example_advanced.models.computed import Person, Rectangle
+    from example_advanced.models.config import AppConfig, CacheConfig, DatabaseConfig
+    from example_advanced.models.validators import (
+        BoundedValue,
+        DataProcessor,
+        PasswordReset,
+    )
 
 __all__ = [
     "AppConfig",
@@ -22,3 +32,29 @@ __all__ = [
     "Person",
     "Rectangle",
 ]
+
+_LAZY: dict[str, str] = {
+    "AppConfig": "example_advanced.models.config",
+    "AuditableEntity": "example_advanced.models.base",
+    "BaseEntity": "example_advanced.models.base",
+    "BoundedValue": "example_advanced.models.validators",
+    "CacheConfig": "example_advanced.models.config",
+    "DatabaseConfig": "example_advanced.models.config",
+    "DataProcessor": "example_advanced.models.validators",
+    "NamedEntity": "example_advanced.models.base",
+    "PasswordReset": "example_advanced.models.validators",
+    "Person": "example_advanced.models.computed",
+    "Rectangle": "example_advanced.models.computed",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class Rectangle(BaseModel):
@@ -32,9 +32,12 @@ class Rectangle(BaseModel):
 class Person(BaseModel):
     """Person with computed full name.
 
-    Demonstrates cached computed fields for expensive operations.
+    Demonstrates cached computed fields for expensive operations. The model is
+    frozen so the cached value cannot go stale when a field is reassigned.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     first_name: str = Field(description="First name.")
     last_name: str = Field(description="Last name.")
     birth_year: int = Field(description="Year of birth.")
@@ -11,9 +11,12 @@ from pydantic import BaseModel, ConfigDict, Field, computed_field
 class DatabaseConfig(BaseModel):
     """Database connection configuration.
 
-    Provides all necessary settings for connecting to a PostgreSQL database.
+    Provides all necessary settings for connecting to a PostgreSQL database. The
+    model is frozen so the cached connection string cannot go stale.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(default="localhost", description="Database host.")
     port: int = Field(default=5432, ge=1, le=65535, description="Database port.")
     name: str = Field(description="Database name.")
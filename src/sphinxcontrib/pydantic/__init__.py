@@ -10,10 +10,6 @@ from typing import TYPE_CHECKING
 
 from sphinx.util import logging
 
-from sphinxcontrib.pydantic._autodoc import register_autodoc_handlers
-from sphinxcontrib.pydantic._compat import register_compat
-from sphinxcontrib.pydantic._config import register_config
-from sphinxcontrib.pydantic._directives import register_directives
 from sphinxcontrib.pydantic._version import __version__
 
 if TYPE_CHECKING:
@@ -39,6 +35,14 @@ def setup(app: Sphinx) -> dict[str, Any]:
     dict[str, Any]
         Extension metadata including version and parallel safety flags.
     """
+    # Imported here rather than at module level so that importing the package
+    # (e.g. to read __version__) does not load pydantic, the directives and the
+    # autodoc handlers.
+    from sphinxcontrib.pydantic._autodoc import register_autodoc_handlers
+    from sphinxcontrib.pydantic._compat import register_compat
+    from sphinxcontrib.pydantic._config import register_config
+    from sphinxcontrib.pydantic._directives import register_directives
+
     _logger.debug("Initializing sphinxcontrib-pydantic extension")
 
     # Register configuration options
@@ -1,10 +1,49 @@
 """Autodoc integration for Pydantic models."""
 
-from sphinxcontrib.pydantic._autodoc._handlers import (
-    PYDANTIC_SKIP_MEMBERS,
-    autodoc_process_docstring,
-    autodoc_skip_member,
-    is_pydantic_internal,
-    register_autodoc_handlers,
-    should_skip_member,
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sphinxcontrib.pydantic._autodoc._handlers import (
+        PYDANTIC_SKIP_MEMBERS,
+        autodoc_process_docstring,
+        autodoc_skip_member,
+        is_pydantic_internal,
+        register_autodoc_handlers,
+        should_skip_member,
+    )
+
+__all__ = (
+    "PYDANTIC_SKIP_MEMBERS",
+    "autodoc_process_docstring",
+    "autodoc_skip_member",
+    "is_pydantic_internal",
+    "register_autodoc_handlers",
+    "should_skip_member",
 )
+
+# Re-exports resolved on first access (PEP 562): the handlers module pulls in the
+# inspection and rendering layers, which are only needed once the extension is set
+# up.
+_LAZY: dict[str, str] = {
+    "PYDANTIC_SKIP_MEMBERS": "sphinxcontrib.pydantic._autodoc._handlers",
+    "autodoc_process_docstring": "sphinxcontrib.pydantic._autodoc._handlers",
+    "autodoc_skip_member": "sphinxcontrib.pydantic._autodoc._handlers",
+    "is_pydantic_internal": "sphinxcontrib.pydantic._autodoc._handlers",
+    "register_autodoc_handlers": "sphinxcontrib.pydantic._autodoc._handlers",
+    "should_skip_member": "sphinxcontrib.pydantic._autodoc._handlers",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
+from importlib import import_module
+from logging import DEBUG
 from typing import TYPE_CHECKING
 
+from pydantic_settings import BaseSettings
 from sphinx.util import logging
 
+from pydantic import BaseModel
 from sphinxcontrib.pydantic._inspection import (
-    filter_mappings_by_field,
+    get_all_field_info,
     get_field_info,
+    get_field_validator_mappings,
     get_model_info,
-    get_validator_field_mappings,
     get_validator_info,
     is_pydantic_model,
     is_pydantic_settings,
@@ -63,10 +69,17 @@ PYDANTIC_SKIP_MEMBERS: frozenset[str] = frozenset(
     }
 )
 
+# Any other __pydantic_* attribute not in the explicit list is skipped as well
+_PYDANTIC_PRIVATE_PREFIX: str = "__pydantic_"
 
+
+@lru_cache(maxsize=4096)
 def is_pydantic_internal(name: str) -> bool:
     """Check if a member name is a Pydantic internal attribute.
 
+    The result only depends on ``name`` and is memoized, as autodoc calls this
+    predicate for every member of every documented class.
+
     Parameters
     ----------
     name : str
@@ -77,18 +90,16 @@ def is_pydantic_internal(name: str) -> bool:
     bool
         True if the name is a Pydantic internal attribute.
     """
-    if name in PYDANTIC_SKIP_MEMBERS:
-        return True
-    # Also skip any __pydantic_* attributes not in the explicit list
-    if name.startswith("__pydantic_"):
-        return True
-    return False
+    return name in PYDANTIC_SKIP_MEMBERS or name.startswith(_PYDANTIC_PRIVATE_PREFIX)
 
 
 # Base classes whose methods should be skipped when documenting Pydantic models.
 # Methods inherited from these classes have Markdown-style docstrings that are
 # incompatible with Sphinx cross-references.
 _PYDANTIC_BASE_CLASSES: tuple[str, ...] = ("BaseModel", "SQLModel")
+_PYDANTIC_BASE_PREFIXES: tuple[str, ...] = tuple(
+    f"{base}." for base in _PYDANTIC_BASE_CLASSES
+)
 
 
 def is_pydantic_base_member(obj: Any) -> bool:
@@ -113,13 +124,17 @@ def is_pydantic_base_member(obj: Any) -> bool:
     qualname = getattr(obj, "__qualname__", "")
     if hasattr(obj, "__func__"):  # classmethod/staticmethod wrapper
         qualname = getattr(obj.__func__, "__qualname__", "")
+    return _is_base_class_qualname(qualname)
 
-    # Check if defined on known Pydantic/SQLModel base classes
-    for base in _PYDANTIC_BASE_CLASSES:
-        if qualname.startswith(f"{base}."):
-            return True
 
-    return False
+@lru_cache(maxsize=4096)
+def _is_base_class_qualname(qualname: str) -> bool:
+    """Check if a qualified name is defined on a Pydantic/SQLModel base class.
+
+    Inherited members share the same handful of qualified names across every
+    model, so the result is memoized per name.
+    """
+    return qualname.startswith(_PYDANTIC_BASE_PREFIXES)
 
 
 def should_skip_member(
@@ -253,7 +268,10 @@ def _process_class_docstring(
     if not is_pydantic_model(obj):
         return
 
-    _logger.debug("Processing Pydantic model: %s", name)
+    # Sphinx's logger adapter does its bookkeeping before the level check, so
+    # test the level first on this per-model path
+    if _logger.isEnabledFor(DEBUG):
+        _logger.debug("Processing Pydantic model: %s", name)
 
     # Get model info
     try:
@@ -266,21 +284,23 @@ def _process_class_docstring(
     prefix = "settings" if is_pydantic_settings(obj) else "model"
     config = config_from_sphinx(app, prefix)
 
+    # Model path for cross-references, shared by the summary tables
+    model_path = f"{obj.__module__}.{obj.__name__}"
+
     # Add field summary if configured
     if config.show_field_summary and model_info.field_names:
-        _add_field_summary(obj, model_info, config, lines)
+        _add_field_summary(obj, model_path, model_info, config, lines)
 
     # Add validator summary if configured (filter private if needed)
-    validators = list(model_info.validator_names) + list(
-        model_info.model_validator_names
-    )
+    validators = model_info.all_validator_names
     if not config.show_private_members:
-        validators = [n for n in validators if not n.startswith("_")]
+        validators = tuple(n for n in validators if not n.startswith("_"))
     if config.show_validator_summary and validators:
-        _add_validator_summary(obj, model_info, validators, config, lines)
+        _add_validator_summary(obj, model_path, model_info, validators, config, lines)
 
-    # Add JSON schema if configured
-    if config.show_json:
+    # Add JSON schema if configured; the base classes themselves, reached through
+    # imported names, have no schema
+    if config.show_json and obj not in (BaseModel, BaseSettings):
         json_lines = generate_json_schema_block(obj)
         if json_lines:
             lines.extend(json_lines)
@@ -301,22 +321,22 @@ def _process_attribute_docstring(
     - "Validated by" section listing validators that affect this field
     """
     # Parse the fully qualified name to get model path and field name
-    parts = name.rsplit(".", 1)
-    if len(parts) != 2:
+    model_path, _, field_name = name.rpartition(".")
+    if not model_path:
         return
 
-    model_path, field_name = parts
-
-    # Try to import the model class
-    try:
-        module_parts = model_path.rsplit(".", 1)
-        if len(module_parts) != 2:
-            return
-        module_name, class_name = module_parts
-        module = __import__(module_name, fromlist=[class_name])
-        model = getattr(module, class_name, None)
-    except (ImportError, AttributeError):
+    # Resolve the model class; autodoc has already imported its module, so
+    # sys.modules is checked before going through the import machinery
+    module_name, _, class_name = model_path.rpartition(".")
+    if not module_name:
         return
+    module = sys.modules.get(module_name)
+    if module is None:
+        try:
+            module = import_module(module_name)
+        except (ImportError, AttributeError):
+            return
+    model = getattr(module, class_name, None)
 
     if not is_pydantic_model(model):
         return
@@ -335,24 +355,21 @@ def _process_attribute_docstring(
     if not lines and field_info.description:
         lines.append(field_info.description)
 
+    config = config_from_sphinx(app)
+
     # Add constraints section if field has constraints
-    show_constraints = getattr(
-        app.config, "sphinxcontrib_pydantic_field_show_constraints", True
-    )
-    if show_constraints and field_info.constraints:
+    if config.field_show_constraints and field_info.constraints:
         if lines:
             lines.append("")
         lines.append(":Constraints:")
-        for key, value in field_info.constraints.items():
-            lines.append(f"   - **{key}** = ``{value}``")
+        lines.extend(
+            f"   - **{key}** = ``{value}``"
+            for key, value in field_info.constraints.items()
+        )
 
     # Get validators for this field (filter private if configured)
-    mappings = get_validator_field_mappings(model)
-    field_mappings = filter_mappings_by_field(mappings, field_name)
-    show_private = getattr(
-        app.config, "sphinxcontrib_pydantic_model_show_private_members", False
-    )
-    if not show_private:
+    field_mappings = get_field_validator_mappings(model, field_name)
+    if not config.show_private_members:
         field_mappings = [
             m for m in field_mappings if not m.validator_name.startswith("_")
         ]
@@ -362,13 +379,15 @@ def _process_attribute_docstring(
         if lines:
             lines.append("")
         lines.append(":Validated by:")
-        for mapping in sorted(field_mappings, key=lambda m: m.validator_name):
-            ref = create_role_reference(mapping.validator_name, mapping.validator_ref)
-            lines.append(f"   {ref}")
+        lines.extend(
+            f"   {create_role_reference(m.validator_name, m.validator_ref)}"
+            for m in field_mappings
+        )
 
 
 def _add_field_summary(
     model: type,
+    model_path: str,
     model_info: Any,
     config: GeneratorConfig,
     lines: list[str],
@@ -382,6 +401,8 @@ def _add_field_summary(
     ----------
     model : type
         The Pydantic model class.
+    model_path : str
+        The fully qualified path to the model (e.g., ``module.ClassName``).
     model_info : ModelInfo
         Information about the model.
     config : GeneratorConfig
@@ -389,11 +410,8 @@ def _add_field_summary(
     lines : list[str]
         The docstring lines to modify.
     """
-    # Build model path for cross-references
-    model_path = f"{model.__module__}.{model.__name__}"
-
     try:
-        fields = [get_field_info(model, name) for name in model_info.field_names]
+        fields = get_all_field_info(model)
 
         # For RootModel, use a cleaner root type display
         if model_info.is_root_model and len(fields) == 1 and fields[0].name == "root":
@@ -418,8 +436,9 @@ def _add_field_summary(
 
 def _add_validator_summary(
     model: type,
+    model_path: str,
     model_info: Any,
-    validator_names: list[str],
+    validator_names: tuple[str, ...],
     config: GeneratorConfig,
     lines: list[str],
 ) -> None:
@@ -429,18 +448,17 @@ def _add_validator_summary(
     ----------
     model : type
         The Pydantic model class.
+    model_path : str
+        The fully qualified path to the model (e.g., ``module.ClassName``).
     model_info : ModelInfo
         Information about the model.
-    validator_names : list[str]
+    validator_names : tuple[str, ...]
         Names of validators to include.
     config : GeneratorConfig
         The generator configuration.
     lines : list[str]
         The docstring lines to modify.
     """
-    # Build model path for cross-references
-    model_path = f"{model.__module__}.{model.__name__}"
-
     try:
         validators = [get_validator_info(model, name) for name in validator_names]
         summary_lines = generate_validator_summary_table(
@@ -492,6 +510,13 @@ def autodoc_process_signature(
     tuple[str | None, str | None] | None
         Modified (signature, return_annotation) or None to use defaults.
     """
+    # Nothing to change unless a parameter list is hidden; the listener stays
+    # connected so that it keeps its place ahead of extensions loaded later
+    if not (
+        app.config.sphinxcontrib_pydantic_model_hide_paramlist
+        or app.config.sphinxcontrib_pydantic_settings_hide_paramlist
+    ):
+        return None
     if what != "class" or not is_pydantic_model(obj):
         return None
 
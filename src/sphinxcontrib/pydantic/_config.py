@@ -11,37 +11,42 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
 
-# Configuration option definitions: (name, default, rebuild_type)
+# Accepted types of the boolean options; int keeps 0/1 values working without a
+# warning, as they did before the types were declared
+_BOOL: tuple[type, ...] = (bool, int)
+
+# Configuration option definitions: (name, default, rebuild_type, types)
 # rebuild_type: 'html' = rebuild HTML, 'env' = rebuild entire environment
-_CONFIG_OPTIONS: list[tuple[str, object, str]] = [
+# types: accepted value types, checked by Sphinx when the config is read
+_CONFIG_OPTIONS: list[tuple[str, object, str, tuple[type, ...]]] = [
     # Model options
-    ("sphinxcontrib_pydantic_model_show_json", False, "html"),
-    ("sphinxcontrib_pydantic_model_show_field_summary", True, "html"),
-    ("sphinxcontrib_pydantic_model_show_validator_summary", True, "html"),
-    ("sphinxcontrib_pydantic_model_show_members", True, "html"),
-    ("sphinxcontrib_pydantic_model_signature_prefix", "model", "html"),
-    ("sphinxcontrib_pydantic_model_hide_paramlist", True, "html"),
+    ("sphinxcontrib_pydantic_model_show_json", False, "html", _BOOL),
+    ("sphinxcontrib_pydantic_model_show_field_summary", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_model_show_validator_summary", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_model_show_members", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_model_signature_prefix", "model", "html", (str,)),
+    ("sphinxcontrib_pydantic_model_hide_paramlist", True, "html", _BOOL),
     # Field options
-    ("sphinxcontrib_pydantic_field_show_alias", True, "html"),
-    ("sphinxcontrib_pydantic_field_show_default", True, "html"),
-    ("sphinxcontrib_pydantic_field_show_required", True, "html"),
-    ("sphinxcontrib_pydantic_field_show_constraints", True, "html"),
+    ("sphinxcontrib_pydantic_field_show_alias", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_field_show_default", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_field_show_required", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_field_show_constraints", True, "html", _BOOL),
     # Member visibility
-    ("sphinxcontrib_pydantic_model_show_private_members", False, "html"),
+    ("sphinxcontrib_pydantic_model_show_private_members", False, "html", _BOOL),
     # Validator options
-    ("sphinxcontrib_pydantic_validator_list_fields", True, "html"),
+    ("sphinxcontrib_pydantic_validator_list_fields", True, "html", _BOOL),
     # Settings options (inherit from model options by default)
-    ("sphinxcontrib_pydantic_settings_show_json", False, "html"),
-    ("sphinxcontrib_pydantic_settings_show_field_summary", True, "html"),
-    ("sphinxcontrib_pydantic_settings_show_validator_summary", True, "html"),
-    ("sphinxcontrib_pydantic_settings_show_members", True, "html"),
-    ("sphinxcontrib_pydantic_settings_signature_prefix", "settings", "html"),
-    ("sphinxcontrib_pydantic_settings_hide_paramlist", True, "html"),
-    ("sphinxcontrib_pydantic_settings_show_private_members", False, "html"),
+    ("sphinxcontrib_pydantic_settings_show_json", False, "html", _BOOL),
+    ("sphinxcontrib_pydantic_settings_show_field_summary", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_settings_show_validator_summary", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_settings_show_members", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_settings_signature_prefix", "settings", "html", (str,)),
+    ("sphinxcontrib_pydantic_settings_hide_paramlist", True, "html", _BOOL),
+    ("sphinxcontrib_pydantic_settings_show_private_members", False, "html", _BOOL),
     # Interoperability: resolve cross-references into ``objects.inv`` files
     # produced by the legacy ``autodoc_pydantic`` extension (see ``_compat``).
     # 'env' rebuild as it affects cross-reference resolution.
-    ("sphinxcontrib_pydantic_resolve_legacy_inventories", False, "env"),
+    ("sphinxcontrib_pydantic_resolve_legacy_inventories", False, "env", _BOOL),
 ]
 
 
@@ -53,5 +58,5 @@ def register_config(app: Sphinx) -> None:
     app : Sphinx
         The Sphinx application instance.
     """
-    for name, default, rebuild in _CONFIG_OPTIONS:
-        app.add_config_value(name, default, rebuild)
+    for name, default, rebuild, types in _CONFIG_OPTIONS:
+        app.add_config_value(name, default, rebuild, types=types)
@@ -2,28 +2,61 @@
 
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
-from sphinxcontrib.pydantic._directives._base import PydanticDirective, flag_or_value
-from sphinxcontrib.pydantic._directives._field import PydanticFieldDirective
-from sphinxcontrib.pydantic._directives._model import (
-    AutoPydanticModelDirective,
-    PydanticModelDirective,
-)
-from sphinxcontrib.pydantic._directives._model import (
-    register_directives as _register_model_directives,
-)
-from sphinxcontrib.pydantic._directives._settings import (
-    AutoPydanticSettingsDirective,
-    PydanticSettingsDirective,
-)
-from sphinxcontrib.pydantic._directives._settings import (
-    register_settings_directives as _register_settings_directives,
-)
-
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
 
+    from sphinxcontrib.pydantic._directives._base import (
+        PydanticDirective,
+        flag_or_value,
+    )
+    from sphinxcontrib.pydantic._directives._field import PydanticFieldDirective
+    from sphinxcontrib.pydantic._directives._model import (
+        AutoPydanticModelDirective,
+        PydanticModelDirective,
+    )
+    from sphinxcontrib.pydantic._directives._settings import (
+        AutoPydanticSettingsDirective,
+        PydanticSettingsDirective,
+    )
+
+__all__ = (
+    "AutoPydanticModelDirective",
+    "AutoPydanticSettingsDirective",
+    "PydanticDirective",
+    "PydanticFieldDirective",
+    "PydanticModelDirective",
+    "PydanticSettingsDirective",
+    "flag_or_value",
+    "register_directives",
+)
+
+# Re-exports resolved on first access (PEP 562) so that the directive modules are
+# only imported once the extension registers them.
+_LAZY: dict[str, str] = {
+    "AutoPydanticModelDirective": "sphinxcontrib.pydantic._directives._model",
+    "AutoPydanticSettingsDirective": "sphinxcontrib.pydantic._directives._settings",
+    "PydanticDirective": "sphinxcontrib.pydantic._directives._base",
+    "PydanticFieldDirective": "sphinxcontrib.pydantic._directives._field",
+    "PydanticModelDirective": "sphinxcontrib.pydantic._directives._model",
+    "PydanticSettingsDirective": "sphinxcontrib.pydantic._directives._settings",
+    "flag_or_value": "sphinxcontrib.pydantic._directives._base",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 def register_directives(app: Sphinx) -> None:
     """Register all Pydantic directives with Sphinx.
@@ -33,8 +66,16 @@ def register_directives(app: Sphinx) -> None:
     app : Sphinx
         The Sphinx application instance.
     """
-    _register_model_directives(app)
-    _register_settings_directives(app)
+    from sphinxcontrib.pydantic._directives._field import PydanticFieldDirective
+    from sphinxcontrib.pydantic._directives._model import (
+        register_directives as register_model_directives,
+    )
+    from sphinxcontrib.pydantic._directives._settings import (
+        register_settings_directives,
+    )
+
+    register_model_directives(app)
+    register_settings_directives(app)
 
     # Register pydantic_field directive in Python domain
     app.add_directive_to_domain("py", "pydantic_field", PydanticFieldDirective)
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar
 
 from docutils.parsers.rst import directives
 from sphinx.util.docutils import SphinxDirective
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any
 
+    from docutils import nodes
+
+# Accepted spellings of an explicit boolean directive option value
+_BOOLEAN_VALUES: dict[str, bool] = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "false": False,
+    "no": False,
+    "0": False,
+}
+
 
 def flag_or_value(argument: str | None) -> bool:
     """Convert a directive option that can be a flag or a boolean value.
@@ -35,13 +49,10 @@ def flag_or_value(argument: str | None) -> bool:
     if argument is None or argument == "":
         return True
 
-    lower = argument.lower()
-    if lower in ("true", "yes", "1"):
-        return True
-    if lower in ("false", "no", "0"):
-        return False
-
-    raise ValueError(f"invalid boolean value: {argument!r}")
+    try:
+        return _BOOLEAN_VALUES[argument.lower()]
+    except KeyError:
+        raise ValueError(f"invalid boolean value: {argument!r}") from None
 
 
 class PydanticDirective(SphinxDirective):
@@ -58,10 +69,12 @@ class PydanticDirective(SphinxDirective):
     optional_arguments: ClassVar[int] = 0
     final_argument_whitespace: ClassVar[bool] = True
 
-    option_spec: ClassVar[dict[str, Any]] = {
-        "module": directives.unchanged,
-        "noindex": directives.flag,
-    }
+    option_spec: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {
+            "module": directives.unchanged,
+            "noindex": directives.flag,
+        }
+    )
 
     def get_object_path(self) -> str:
         """Get the full object path from arguments and options.
@@ -79,3 +92,18 @@ class PydanticDirective(SphinxDirective):
             return f"{module}.{name}"
 
         return name
+
+    def _warn(self, message: str) -> list[nodes.Node]:
+        """Report a warning at the directive's line.
+
+        Parameters
+        ----------
+        message : str
+            The warning message.
+
+        Returns
+        -------
+        list[nodes.Node]
+            The system message node, to be returned from ``run()``.
+        """
+        return [self.state.document.reporter.warning(message, line=self.lineno)]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from logging import DEBUG
 from typing import TYPE_CHECKING
 
 from sphinx.util import logging
@@ -24,7 +25,8 @@ def process_docstring(
 
     Emits the ``autodoc-process-docstring`` event to allow extensions like
     Napoleon and numpydoc to process the docstring. If the event is not
-    registered (autodoc not loaded), returns the raw docstring lines.
+    registered (autodoc not loaded) or has no listeners, returns the raw
+    docstring lines.
 
     Parameters
     ----------
@@ -51,16 +53,19 @@ def process_docstring(
     if not stripped:
         return []
 
-    lines = stripped.split("\n")
+    lines = stripped.splitlines()
 
-    # Check if the autodoc-process-docstring event is registered
-    # This event is registered by autodoc, which Napoleon and numpydoc depend on
-    if "autodoc-process-docstring" not in app.events.events:
-        _logger.debug(
-            "autodoc-process-docstring event not registered, "
-            "returning raw docstring for %s",
-            name,
-        )
+    # Check if the autodoc-process-docstring event is registered and has
+    # listeners. It is registered by autodoc, which Napoleon and numpydoc depend
+    # on; emitting it without listeners would not change the lines.
+    event = "autodoc-process-docstring"
+    if event not in app.events.events or not app.events.listeners.get(event):
+        if _logger.isEnabledFor(DEBUG):
+            _logger.debug(
+                "autodoc-process-docstring event not registered or unused, "
+                "returning raw docstring for %s",
+                name,
+            )
         return lines
 
     # Emit the event - handlers modify lines in-place
@@ -71,7 +76,7 @@ def process_docstring(
     # - options: autodoc options (None is valid - handlers check for it)
     # - lines: docstring lines (modified in-place by handlers)
     app.emit(
-        "autodoc-process-docstring",
+        event,
         what,
         name,
         obj,
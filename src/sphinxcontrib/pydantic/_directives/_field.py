@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar
 
 from docutils.parsers.rst import directives
@@ -10,11 +11,11 @@ from sphinx.domains.python import PyAttribute
 from sphinx.locale import _
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+    from typing import Any
 
     from docutils.nodes import Node
     from sphinx.addnodes import desc_signature
-    from sphinx.util.typing import OptionSpec
 
 
 class PydanticFieldDirective(PyAttribute):
@@ -25,9 +26,9 @@ class PydanticFieldDirective(PyAttribute):
     markers in the signature.
     """
 
-    option_spec: ClassVar[OptionSpec] = PyAttribute.option_spec.copy()
-    option_spec.update(
+    option_spec: ClassVar[Mapping[str, Any]] = MappingProxyType(
         {
+            **PyAttribute.option_spec,
             "required": directives.flag,
             "optional": directives.flag,
         }
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import cache
+from importlib import import_module
+from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar
 
 from docutils import nodes
@@ -18,22 +21,24 @@ from sphinxcontrib.pydantic._directives._docstring import process_docstring
 from sphinxcontrib.pydantic._inspection import (
     FieldInfo,
     ValidatorInfo,
-    filter_mappings_by_field,
-    get_field_info,
+    get_all_field_info,
+    get_field_validator_mappings,
     get_model_info,
-    get_validator_field_mappings,
     get_validator_info,
     is_pydantic_model,
 )
 from sphinxcontrib.pydantic._rendering import (
+    BY_NAME,
     GeneratorConfig,
     config_from_directive,
     create_role_reference,
     generate_field_summary_table,
     generate_validator_summary_table,
+    render_json_schema,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
     from typing import Any
 
     from sphinx.application import Sphinx
@@ -62,31 +67,39 @@ class PydanticModelDirective(PydanticDirective):
     #: Config prefix for looking up Sphinx config values ("model" or "settings")
     _config_prefix: ClassVar[str] = "model"
 
-    option_spec: ClassVar[dict[str, Any]] = {
-        # Inherited from base
-        "module": directives.unchanged,
-        "noindex": directives.flag,
-        # Model-specific display options
-        "show-json": flag_or_value,
-        "show-field-summary": flag_or_value,
-        "show-validator-summary": flag_or_value,
-        "show-members": flag_or_value,
-        # Field display options
-        "show-alias": flag_or_value,
-        "show-default": flag_or_value,
-        "show-required": flag_or_value,
-        "show-constraints": flag_or_value,
-        # Validator display options
-        "list-fields": flag_or_value,
-        # Signature options
-        "signature-prefix": directives.unchanged,
-        "hide-paramlist": flag_or_value,
-        # Member options
-        "members": directives.unchanged,
-        "inherited-members": directives.unchanged,
-        "undoc-members": directives.flag,
-        "show-private-members": flag_or_value,
-    }
+    #: Warning emitted when the object can not be imported
+    _not_found_message: ClassVar[str] = "Cannot find Pydantic model"
+
+    #: Warning emitted when the object fails :meth:`_check_model`
+    _invalid_message: ClassVar[str] = "Object is not a Pydantic model"
+
+    option_spec: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {
+            # Inherited from base
+            "module": directives.unchanged,
+            "noindex": directives.flag,
+            # Model-specific display options
+            "show-json": flag_or_value,
+            "show-field-summary": flag_or_value,
+            "show-validator-summary": flag_or_value,
+            "show-members": flag_or_value,
+            # Field display options
+            "show-alias": flag_or_value,
+            "show-default": flag_or_value,
+            "show-required": flag_or_value,
+            "show-constraints": flag_or_value,
+            # Validator display options
+            "list-fields": flag_or_value,
+            # Signature options
+            "signature-prefix": directives.unchanged,
+            "hide-paramlist": flag_or_value,
+            # Member options
+            "members": directives.unchanged,
+            "inherited-members": directives.unchanged,
+            "undoc-members": directives.flag,
+            "show-private-members": flag_or_value,
+        }
+    )
 
     def run(self) -> list[nodes.Node]:
         """Run the directive and generate documentation nodes.
@@ -101,20 +114,10 @@ class PydanticModelDirective(PydanticDirective):
         model = self._import_model(objpath)
 
         if model is None:
-            return [
-                self.state.document.reporter.warning(
-                    f"Cannot find Pydantic model: {objpath}",
-                    line=self.lineno,
-                )
-            ]
+            return self._warn(f"{self._not_found_message}: {objpath}")
 
-        if not is_pydantic_model(model):
-            return [
-                self.state.document.reporter.warning(
-                    f"Object is not a Pydantic model: {objpath}",
-                    line=self.lineno,
-                )
-            ]
+        if not self._check_model(model):
+            return self._warn(f"{self._invalid_message}: {objpath}")
 
         # Get model info
         model_info = get_model_info(model)
@@ -122,6 +125,21 @@ class PydanticModelDirective(PydanticDirective):
         # Generate the documentation
         return self._generate_model_docs(model, model_info)
 
+    def _check_model(self, model: Any) -> bool:
+        """Check that the imported object can be documented by this directive.
+
+        Parameters
+        ----------
+        model : Any
+            The imported object.
+
+        Returns
+        -------
+        bool
+            True if the object is a Pydantic model class.
+        """
+        return is_pydantic_model(model)
+
     def _import_model(self, objpath: str) -> type[BaseModel] | None:
         """Import a model class from its path.
 
@@ -135,19 +153,11 @@ class PydanticModelDirective(PydanticDirective):
         type[BaseModel] | None
             The model class, or None if not found.
         """
-        try:
-            parts = objpath.rsplit(".", 1)
-            if len(parts) == 1:
-                # No module specified, try current module context
-                _logger.warning("No module specified for model: %s", objpath)
-                return None
-
-            module_path, class_name = parts
-            module = __import__(module_path, fromlist=[class_name])
-            return getattr(module, class_name, None)
-        except (ImportError, AttributeError) as e:
-            _logger.debug("Failed to import model %s: %s", objpath, e)
+        if "." not in objpath:
+            # No module specified, try current module context
+            _logger.warning("No module specified for model: %s", objpath)
             return None
+        return _import_object(objpath)
 
     def _generate_model_docs(
         self,
@@ -207,38 +217,60 @@ class PydanticModelDirective(PydanticDirective):
         # Create the content
         content = addnodes.desc_content()
 
-        # Add docstring
-        if model_info.docstring:
-            self._parse_docstring(model_info.docstring, content)
-
         # Compute model path for cross-references
         model_path = f"{model_info.module}.{model_info.name}"
 
-        # Collect field and validator info for summary tables and detailed docs.
-        # Filter out private members (names starting with "_") when configured.
-        field_names = model_info.field_names
-        if not config.show_private_members:
-            field_names = tuple(n for n in field_names if not n.startswith("_"))
-        fields: list[FieldInfo] = []
-        if field_names:
-            fields = [get_field_info(model, name) for name in field_names]
-
-        validators = list(model_info.validator_names) + list(
-            model_info.model_validator_names
-        )
-        if not config.show_private_members:
-            validators = [n for n in validators if not n.startswith("_")]
-        validator_infos: list[ValidatorInfo] = []
-        if validators:
-            validator_infos = [get_validator_info(model, name) for name in validators]
+        # Collect field and validator info for summary tables and detailed docs,
+        # only when one of them is going to be rendered. Filter out private
+        # members (names starting with "_") when configured. Both are sorted by
+        # name once, for the summary tables and the detailed docs alike.
+        fields: tuple[FieldInfo, ...] = ()
+        if config.show_field_summary or config.show_members:
+            fields = tuple(
+                sorted(
+                    (
+                        f
+                        for f in get_all_field_info(model)
+                        if config.show_private_members or not f.name.startswith("_")
+                    ),
+                    key=BY_NAME,
+                )
+            )
 
-        # Add field summary table
-        if config.show_field_summary and fields:
-            self._add_field_summary(fields, model_path, config, content)
+        validator_infos: tuple[ValidatorInfo, ...] = ()
+        if config.show_validator_summary or config.show_members:
+            validator_names = model_info.all_validator_names
+            if not config.show_private_members:
+                validator_names = tuple(
+                    n for n in validator_names if not n.startswith("_")
+                )
+            validator_infos = tuple(
+                sorted(
+                    (get_validator_info(model, name) for name in validator_names),
+                    key=BY_NAME,
+                )
+            )
 
-        # Add validator summary table
+        # The docstring and the summary tables are all RST, parse them together
+        # in a single nested_parse() call, separated by blank lines.
+        blocks: list[list[str]] = []
+        if model_info.docstring:
+            blocks.append(self._docstring_lines(model_info.docstring))
+        if config.show_field_summary and fields:
+            blocks.append(self._field_summary_lines(fields, model_path, config))
         if config.show_validator_summary and validator_infos:
-            self._add_validator_summary(validator_infos, model_path, config, content)
+            blocks.append(
+                self._validator_summary_lines(validator_infos, model_path, config)
+            )
+        rst_lines: list[str] = []
+        for block in blocks:
+            if not block:
+                continue
+            if rst_lines:
+                rst_lines.append("")
+            rst_lines.extend(block)
+        if rst_lines:
+            self.state.nested_parse(StringList(rst_lines), 0, content)
 
         # Add JSON schema if requested
         if config.show_json:
@@ -257,27 +289,26 @@ class PydanticModelDirective(PydanticDirective):
 
         return result
 
-    def _parse_docstring(
-        self,
-        docstring: str,
-        parent: nodes.Element,
-    ) -> None:
-        """Parse a docstring and add it to the parent node.
+    def _docstring_lines(self, docstring: str) -> list[str]:
+        """Process a docstring into RST lines.
 
         Processes the docstring through registered autodoc handlers
-        (Napoleon, numpydoc, custom) then parses the result as RST.
+        (Napoleon, numpydoc, custom).
 
         Parameters
         ----------
         docstring : str
             The docstring text.
-        parent : nodes.Element
-            The parent node to add content to.
+
+        Returns
+        -------
+        list[str]
+            The processed docstring lines.
         """
         # Process through registered docstring handlers
         # Note: Using env._app directly as env.app is deprecated in Sphinx 11
         # with no replacement (N/A). This follows Sphinx's internal pattern.
-        lines = process_docstring(
+        return process_docstring(
             self.env._app,
             docstring,
             what="class",
@@ -285,31 +316,29 @@ class PydanticModelDirective(PydanticDirective):
             obj=None,  # Could pass model class if needed
         )
 
-        if lines:
-            string_list = StringList(lines)
-            self.state.nested_parse(string_list, 0, parent)
-
-    def _add_field_summary(
+    def _field_summary_lines(
         self,
-        fields: list[FieldInfo],
+        fields: Sequence[FieldInfo],
         model_path: str,
         config: GeneratorConfig,
-        parent: nodes.Element,
-    ) -> None:
-        """Add a field summary table to the parent node.
+    ) -> list[str]:
+        """Generate the RST lines of a field summary table.
 
         Parameters
         ----------
-        fields : list[FieldInfo]
+        fields : Sequence[FieldInfo]
             The fields to summarize.
         model_path : str
             The fully qualified path to the model (e.g., ``module.ClassName``).
         config : GeneratorConfig
             The generator configuration.
-        parent : nodes.Element
-            The parent node to add content to.
+
+        Returns
+        -------
+        list[str]
+            RST lines for the field summary table.
         """
-        lines = generate_field_summary_table(
+        return generate_field_summary_table(
             fields,
             model_path,
             show_alias=config.field_show_alias,
@@ -318,40 +347,34 @@ class PydanticModelDirective(PydanticDirective):
             show_constraints=config.field_show_constraints,
         )
 
-        if lines:
-            string_list = StringList(lines)
-            self.state.nested_parse(string_list, 0, parent)
-
-    def _add_validator_summary(
+    def _validator_summary_lines(
         self,
-        validators: list[ValidatorInfo],
+        validators: Sequence[ValidatorInfo],
         model_path: str,
         config: GeneratorConfig,
-        parent: nodes.Element,
-    ) -> None:
-        """Add a validator summary table to the parent node.
+    ) -> list[str]:
+        """Generate the RST lines of a validator summary table.
 
         Parameters
         ----------
-        validators : list[ValidatorInfo]
+        validators : Sequence[ValidatorInfo]
             The validators to summarize.
         model_path : str
             The fully qualified path to the model (e.g., ``module.ClassName``).
         config : GeneratorConfig
             The generator configuration.
-        parent : nodes.Element
-            The parent node to add content to.
+
+        Returns
+        -------
+        list[str]
+            RST lines for the validator summary table.
         """
-        lines = generate_validator_summary_table(
+        return generate_validator_summary_table(
             validators,
             model_path,
             list_fields=config.validator_list_fields,
         )
 
-        if lines:
-            string_list = StringList(lines)
-            self.state.nested_parse(string_list, 0, parent)
-
     def _add_json_schema(
         self,
         model: type[BaseModel],
@@ -366,11 +389,8 @@ class PydanticModelDirective(PydanticDirective):
         parent : nodes.Element
             The parent node to add content to.
         """
-        import json
-
         try:
-            schema = model.model_json_schema()
-            schema_str = json.dumps(schema, indent=2)
+            schema_str = render_json_schema(model)
 
             # Create a code block
             literal = nodes.literal_block(schema_str, schema_str)
@@ -381,7 +401,7 @@ class PydanticModelDirective(PydanticDirective):
 
     def _generate_field_docs(
         self,
-        fields: list[FieldInfo],
+        fields: Sequence[FieldInfo],
         model: type[BaseModel],
         model_path: str,
         config: GeneratorConfig,
@@ -394,8 +414,8 @@ class PydanticModelDirective(PydanticDirective):
 
         Parameters
         ----------
-        fields : list[FieldInfo]
-            The fields to document.
+        fields : Sequence[FieldInfo]
+            The fields to document, sorted by name.
         model : type[BaseModel]
             The Pydantic model class.
         model_path : str
@@ -405,21 +425,23 @@ class PydanticModelDirective(PydanticDirective):
         parent : nodes.Element
             The parent node to add content to.
         """
-        # Get validator-field mappings for "Validated by" sections
-        mappings = get_validator_field_mappings(model)
-
-        for field in sorted(fields, key=lambda f: f.name):
+        module_name, _, class_name = model_path.rpartition(".")
+        noindex = "noindex" in self.options
+        env = self.env
+        document = self.state.document
+        domain = env.domains.python_domain
+        for field in fields:
             # Create the field desc node
             field_desc = addnodes.desc()
             field_desc["domain"] = "py"
             field_desc["objtype"] = "attribute"
-            field_desc["noindex"] = "noindex" in self.options
+            field_desc["noindex"] = noindex
 
             # Create the signature
             sig = addnodes.desc_signature()
-            sig["module"] = model_path.rsplit(".", 1)[0] if "." in model_path else ""
-            sig["class"] = model_path.rsplit(".", 1)[-1]
-            sig["fullname"] = f"{model_path.rsplit('.', 1)[-1]}.{field.name}"
+            sig["module"] = module_name
+            sig["class"] = class_name
+            sig["fullname"] = f"{class_name}.{field.name}"
 
             # Add "field" prefix
             sig += addnodes.desc_sig_keyword("", "field")
@@ -434,7 +456,7 @@ class PydanticModelDirective(PydanticDirective):
                 sig += addnodes.desc_sig_space()
                 # Convert type to string, then parse to nodes with cross-references
                 type_str = stringify_annotation(field.annotation, mode="smart")
-                type_nodes = _parse_annotation(type_str, self.env)
+                type_nodes = _parse_annotation(type_str, env)
                 for node in type_nodes:
                     sig += node
 
@@ -446,13 +468,11 @@ class PydanticModelDirective(PydanticDirective):
                 sig += addnodes.desc_annotation("", "[Optional]")
 
             # Register the field with Python domain for cross-referencing
-            if "noindex" not in self.options:
+            if not noindex:
                 fullname = f"{model_path}.{field.name}"
-                node_id = make_id(self.env, self.state.document, "", fullname)
+                node_id = make_id(env, document, "", fullname)
                 sig["ids"].append(node_id)
-                self.state.document.note_explicit_target(sig)
-
-                domain = self.env.domains.python_domain
+                document.note_explicit_target(sig)
                 domain.note_object(fullname, "attribute", node_id, location=sig)
 
             field_desc += sig
@@ -465,29 +485,29 @@ class PydanticModelDirective(PydanticDirective):
 
             # Add description
             if field.description:
-                content_lines.append(field.description)
-                content_lines.append("")
+                content_lines.extend((field.description, ""))
 
             # Add constraints section
             if config.field_show_constraints and field.constraints:
                 content_lines.append(":Constraints:")
-                for key, value in field.constraints.items():
-                    content_lines.append(f"   - **{key}** = ``{value}``")
+                content_lines.extend(
+                    f"   - **{key}** = ``{value}``"
+                    for key, value in field.constraints.items()
+                )
                 content_lines.append("")
 
             # Add "Validated by" section (filter private validators)
-            field_mappings = filter_mappings_by_field(mappings, field.name)
+            field_mappings = get_field_validator_mappings(model, field.name)
             if not config.show_private_members:
                 field_mappings = [
                     m for m in field_mappings if not m.validator_name.startswith("_")
                 ]
             if field_mappings:
                 content_lines.append(":Validated by:")
-                for mapping in sorted(field_mappings, key=lambda m: m.validator_name):
-                    ref = create_role_reference(
-                        mapping.validator_name, mapping.validator_ref
-                    )
-                    content_lines.append(f"   {ref}")
+                content_lines.extend(
+                    f"   {create_role_reference(m.validator_name, m.validator_ref)}"
+                    for m in field_mappings
+                )
                 content_lines.append("")
 
             # Parse the content lines into nodes
@@ -500,7 +520,7 @@ class PydanticModelDirective(PydanticDirective):
 
     def _generate_validator_docs(
         self,
-        validators: list[ValidatorInfo],
+        validators: Sequence[ValidatorInfo],
         model_path: str,
         parent: nodes.Element,
     ) -> None:
@@ -511,25 +531,30 @@ class PydanticModelDirective(PydanticDirective):
 
         Parameters
         ----------
-        validators : list[ValidatorInfo]
-            The validators to document.
+        validators : Sequence[ValidatorInfo]
+            The validators to document, sorted by name.
         model_path : str
             The fully qualified path to the model (e.g., ``module.ClassName``).
         parent : nodes.Element
             The parent node to add content to.
         """
-        for validator in sorted(validators, key=lambda v: v.name):
+        module_name, _, class_name = model_path.rpartition(".")
+        noindex = "noindex" in self.options
+        env = self.env
+        document = self.state.document
+        domain = env.domains.python_domain
+        for validator in validators:
             # Create the validator desc node
             validator_desc = addnodes.desc()
             validator_desc["domain"] = "py"
             validator_desc["objtype"] = "method"
-            validator_desc["noindex"] = "noindex" in self.options
+            validator_desc["noindex"] = noindex
 
             # Create the signature
             sig = addnodes.desc_signature()
-            sig["module"] = model_path.rsplit(".", 1)[0] if "." in model_path else ""
-            sig["class"] = model_path.rsplit(".", 1)[-1]
-            sig["fullname"] = f"{model_path.rsplit('.', 1)[-1]}.{validator.name}"
+            sig["module"] = module_name
+            sig["class"] = class_name
+            sig["fullname"] = f"{class_name}.{validator.name}"
 
             # Add "validator" prefix
             sig += addnodes.desc_sig_keyword("", "validator")
@@ -544,13 +569,11 @@ class PydanticModelDirective(PydanticDirective):
             sig += addnodes.desc_sig_punctuation("", ")")
 
             # Register the validator with Python domain for cross-referencing
-            if "noindex" not in self.options:
+            if not noindex:
                 fullname = f"{validator.defining_class_path}.{validator.name}"
-                node_id = make_id(self.env, self.state.document, "", fullname)
+                node_id = make_id(env, document, "", fullname)
                 sig["ids"].append(node_id)
-                self.state.document.note_explicit_target(sig)
-
-                domain = self.env.domains.python_domain
+                document.note_explicit_target(sig)
                 domain.note_object(fullname, "method", node_id, location=sig)
 
             validator_desc += sig
@@ -563,8 +586,7 @@ class PydanticModelDirective(PydanticDirective):
 
             # Add docstring
             if validator.docstring:
-                content_lines.append(validator.docstring)
-                content_lines.append("")
+                content_lines.extend((validator.docstring, ""))
 
             # Add fields section for field validators
             if validator.fields and not validator.is_model_validator:
@@ -582,8 +604,7 @@ class PydanticModelDirective(PydanticDirective):
                         content_lines.append(f"   {ref}")
                 content_lines.append("")
             elif validator.is_model_validator:
-                content_lines.append(":Validates: entire model")
-                content_lines.append("")
+                content_lines.extend((":Validates: entire model", ""))
 
             # Parse the content lines into nodes
             if content_lines:
@@ -594,6 +615,46 @@ class PydanticModelDirective(PydanticDirective):
             parent += validator_desc
 
 
+@cache
+def _import_object(objpath: str) -> Any:
+    """Import an object from its fully qualified path.
+
+    Results, including failures, are cached per path so that a model
+    documented from several pages is only resolved once per build. The cache
+    is cleared when the build finishes.
+
+    Parameters
+    ----------
+    objpath : str
+        The fully qualified object path (e.g., ``module.ClassName``).
+
+    Returns
+    -------
+    Any
+        The object, or None if it cannot be imported.
+    """
+    module_path, _, name = objpath.rpartition(".")
+    try:
+        module = import_module(module_path)
+    except (ImportError, AttributeError) as e:
+        _logger.debug("Failed to import model %s: %s", objpath, e)
+        return None
+    return getattr(module, name, None)
+
+
+def _clear_import_cache(app: Sphinx, exception: Exception | None) -> None:
+    """Clear the cached model imports once the build has finished.
+
+    Parameters
+    ----------
+    app : Sphinx
+        The Sphinx application instance.
+    exception : Exception | None
+        The exception that stopped the build, if any.
+    """
+    _import_object.cache_clear()
+
+
 class AutoPydanticModelDirective(PydanticModelDirective):
     """Auto-documenting directive for Pydantic models.
 
@@ -618,3 +679,4 @@ def register_directives(app: Sphinx) -> None:
     """
     app.add_directive("pydantic-model", PydanticModelDirective)
     app.add_directive("autopydantic-model", AutoPydanticModelDirective)
+    app.connect("build-finished", _clear_import_cache)
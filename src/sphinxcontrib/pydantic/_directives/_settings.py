@@ -4,11 +4,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, ClassVar
 
-from docutils import nodes
 from sphinx.util import logging
 
 from sphinxcontrib.pydantic._directives._model import PydanticModelDirective
-from sphinxcontrib.pydantic._inspection import get_model_info, is_pydantic_settings
+from sphinxcontrib.pydantic._inspection import is_pydantic_settings
 
 if TYPE_CHECKING:
     from typing import Any
@@ -37,43 +36,23 @@ class PydanticSettingsDirective(PydanticModelDirective):
     #: Config prefix for looking up Sphinx config values
     _config_prefix: ClassVar[str] = "settings"
 
-    option_spec: ClassVar[dict[str, Any]] = {
-        **PydanticModelDirective.option_spec,
-    }
+    _not_found_message: ClassVar[str] = "Cannot find Pydantic settings"
+    _invalid_message: ClassVar[str] = "Object is not a Pydantic settings class"
 
-    def run(self) -> list[nodes.Node]:
-        """Run the directive and generate documentation nodes.
+    def _check_model(self, model: Any) -> bool:
+        """Check that the imported object is a Pydantic settings class.
+
+        Parameters
+        ----------
+        model : Any
+            The imported object.
 
         Returns
         -------
-        list[nodes.Node]
-            List of docutils nodes representing the settings documentation.
+        bool
+            True if the object is a Pydantic settings class.
         """
-        # Get the settings class
-        objpath = self.get_object_path()
-        model = self._import_model(objpath)
-
-        if model is None:
-            return [
-                self.state.document.reporter.warning(
-                    f"Cannot find Pydantic settings: {objpath}",
-                    line=self.lineno,
-                )
-            ]
-
-        if not is_pydantic_settings(model):
-            return [
-                self.state.document.reporter.warning(
-                    f"Object is not a Pydantic settings class: {objpath}",
-                    line=self.lineno,
-                )
-            ]
-
-        # Get model info (settings are also models)
-        model_info = get_model_info(model)
-
-        # Generate the documentation using parent's method
-        return self._generate_model_docs(model, model_info)
+        return is_pydantic_settings(model)
 
 
 class AutoPydanticSettingsDirective(PydanticSettingsDirective):
@@ -4,7 +4,11 @@ This module provides utilities for introspecting Pydantic v2 models,
 extracting field information, validators, and other metadata.
 """
 
-from sphinxcontrib.pydantic._inspection._field import FieldInfo, get_field_info
+from sphinxcontrib.pydantic._inspection._field import (
+    FieldInfo,
+    get_all_field_info,
+    get_field_info,
+)
 from sphinxcontrib.pydantic._inspection._model import (
     ModelInfo,
     get_model_info,
@@ -17,6 +21,7 @@ from sphinxcontrib.pydantic._inspection._references import (
     ValidatorFieldMap,
     filter_mappings_by_field,
     filter_mappings_by_validator,
+    get_field_validator_mappings,
     get_validator_field_mappings,
 )
 from sphinxcontrib.pydantic._inspection._validator import (
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from pydantic_core import PydanticUndefined
 
@@ -57,7 +59,8 @@ class FieldInfo:
     title : str | None
         The field title, if any.
     examples : list[Any] | None
-        Example values for the field, if any.
+        Example values for the field, if any. A list set on the Pydantic field is
+        shared, not copied, and must not be mutated.
     constraints : dict[str, Any]
         Constraints on the field (ge, le, pattern, etc.).
     """
@@ -75,9 +78,22 @@ class FieldInfo:
     constraints: dict[str, Any] = field(default_factory=dict)
 
 
+#: FieldInfo per model class and field name. Weak keys let models created on the
+#: fly be garbage collected.
+_FIELD_INFO_CACHE: WeakKeyDictionary[type, dict[str, FieldInfo]] = WeakKeyDictionary()
+
+#: FieldInfo of every field, in definition order, per model class.
+_ALL_FIELD_INFO_CACHE: WeakKeyDictionary[type, tuple[FieldInfo, ...]] = (
+    WeakKeyDictionary()
+)
+
+
 def get_field_info(model: type[BaseModel], field_name: str) -> FieldInfo:
     """Extract information about a specific field from a Pydantic model.
 
+    The result is cached per model class and field name once the model is fully
+    built.
+
     Parameters
     ----------
     model : type[BaseModel]
@@ -100,11 +116,77 @@ def get_field_info(model: type[BaseModel], field_name: str) -> FieldInfo:
     if not is_pydantic_model(model):
         raise TypeError(f"{model!r} is not a Pydantic model class.")
 
+    try:
+        return _FIELD_INFO_CACHE[model][field_name]
+    except KeyError:
+        pass
+
     if field_name not in model.model_fields:
         raise KeyError(f"Field '{field_name}' does not exist in model {model.__name__}")
 
-    pydantic_field = model.model_fields[field_name]
+    field_info = _build_field_info(field_name, model.model_fields[field_name])
+    # A model with unresolved forward references is completed by a later
+    # model_rebuild(), which can still change its field annotations.
+    if model.__pydantic_complete__:
+        _FIELD_INFO_CACHE.setdefault(model, {})[field_name] = field_info
+    return field_info
+
+
+def get_all_field_info(model: type[BaseModel]) -> tuple[FieldInfo, ...]:
+    """Extract information about all fields of a Pydantic model.
+
+    The result is cached per model class once the model is fully built.
+
+    Parameters
+    ----------
+    model : type[BaseModel]
+        The Pydantic model class.
+
+    Returns
+    -------
+    tuple[FieldInfo, ...]
+        Information about each field, in definition order.
+
+    Raises
+    ------
+    TypeError
+        If the provided object is not a Pydantic model class.
+    """
+    if not is_pydantic_model(model):
+        raise TypeError(f"{model!r} is not a Pydantic model class.")
+
+    try:
+        return _ALL_FIELD_INFO_CACHE[model]
+    except KeyError:
+        pass
 
+    # Validate the model once and reuse the FieldInfo already built per field
+    field_infos = _FIELD_INFO_CACHE.get(model, {})
+    fields = tuple(
+        field_infos.get(name) or _build_field_info(name, pydantic_field)
+        for name, pydantic_field in model.model_fields.items()
+    )
+    if model.__pydantic_complete__:
+        _FIELD_INFO_CACHE[model] = {f.name: f for f in fields}
+        _ALL_FIELD_INFO_CACHE[model] = fields
+    return fields
+
+
+def _build_field_info(field_name: str, pydantic_field: Any) -> FieldInfo:
+    """Build the FieldInfo of a Pydantic field.
+
+    Parameters
+    ----------
+    field_name : str
+        The name of the field.
+    pydantic_field : pydantic.fields.FieldInfo
+        The Pydantic FieldInfo object.
+
+    Returns
+    -------
+    FieldInfo
+        Information about the field.
+    """
     # Get annotation
     annotation = pydantic_field.annotation
 
@@ -127,8 +209,12 @@ def get_field_info(model: type[BaseModel], field_name: str) -> FieldInfo:
     # Get title
     title = pydantic_field.title
 
-    # Get examples
+    # Get examples, only copying them when they are not already a list
     examples = pydantic_field.examples
+    if not examples:
+        examples = None
+    elif type(examples) is not list:
+        examples = list(examples)
 
     # Extract constraints from metadata
     constraints = _extract_constraints(pydantic_field)
@@ -143,11 +229,32 @@ def get_field_info(model: type[BaseModel], field_name: str) -> FieldInfo:
         alias=alias,
         description=description,
         title=title,
-        examples=list(examples) if examples else None,
+        examples=examples,
         constraints=constraints,
     )
 
 
+@lru_cache(maxsize=256)
+def _metadata_class_attrs(cls: type) -> frozenset[str]:
+    """Get the constraint attributes defined on a metadata class.
+
+    Those are slots, properties or class attributes; attributes set on instances
+    are looked up separately. Metadata classes are few and mostly module-level, so
+    a bounded cache is enough.
+
+    Parameters
+    ----------
+    cls : type
+        The class of a field metadata object.
+
+    Returns
+    -------
+    frozenset[str]
+        The constraint attribute names available on the class.
+    """
+    return frozenset(attr for attr in _CONSTRAINT_ATTRS if hasattr(cls, attr))
+
+
 def _extract_constraints(pydantic_field: Any) -> dict[str, Any]:
     """Extract constraints from a Pydantic field.
 
@@ -161,14 +268,25 @@ def _extract_constraints(pydantic_field: Any) -> dict[str, Any]:
     dict[str, Any]
         Dictionary of constraints.
     """
+    metadata = pydantic_field.metadata
+    if not metadata:
+        return {}
+
     constraints: dict[str, Any] = {}
 
-    # Check metadata for constraint annotations
-    for meta in pydantic_field.metadata:
-        for attr in _CONSTRAINT_ATTRS:
-            if hasattr(meta, attr):
-                value = getattr(meta, attr)
-                if value is not None:
-                    constraints[attr] = value
+    # Check metadata for constraint annotations, only probing the constraint
+    # attributes the metadata object actually has
+    for meta in metadata:
+        attrs = _metadata_class_attrs(type(meta))
+        instance_dict = getattr(meta, "__dict__", None)
+        if instance_dict:
+            attrs = attrs.union(_CONSTRAINT_ATTRS.intersection(instance_dict))
+        if not attrs:
+            # Attributes served by __getattr__ are invisible to both lookups
+            attrs = _CONSTRAINT_ATTRS
+        for attr in attrs:
+            value = getattr(meta, attr, None)
+            if value is not None:
+                constraints[attr] = value
 
     return constraints
@@ -106,6 +106,8 @@ class ModelInfo:
         Names of all field validators in the model.
     model_validator_names : tuple[str, ...]
         Names of all model validators in the model.
+    all_validator_names : tuple[str, ...]
+        Names of all field validators followed by all model validators.
     model : type[BaseModel]
         Reference to the original model class.
     is_root_model : bool
@@ -120,6 +122,7 @@ class ModelInfo:
     computed_field_names: tuple[str, ...] = field(default_factory=tuple)
     validator_names: tuple[str, ...] = field(default_factory=tuple)
     model_validator_names: tuple[str, ...] = field(default_factory=tuple)
+    all_validator_names: tuple[str, ...] = field(default_factory=tuple)
     model: type[BaseModel] = field(repr=False, default=None)
     is_root_model: bool = False
 
@@ -151,16 +154,14 @@ def get_model_info(model: type[BaseModel]) -> ModelInfo:
     qualname = model.__qualname__
     docstring = model.__doc__
 
-    # Extract field names
-    field_names = tuple(model.model_fields.keys())
-
-    # Extract computed field names
-    computed_field_names = tuple(model.model_computed_fields.keys())
+    # Extract field and computed field names
+    field_names = tuple(model.model_fields)
+    computed_field_names = tuple(model.model_computed_fields)
 
     # Extract validator names from pydantic decorators
     decorators = model.__pydantic_decorators__
-    validator_names = list(decorators.field_validators.keys())
-    model_validator_names = list(decorators.model_validators.keys())
+    validator_names = tuple(decorators.field_validators)
+    model_validator_names = tuple(decorators.model_validators)
 
     return ModelInfo(
         name=name,
@@ -168,9 +169,10 @@ def get_model_info(model: type[BaseModel]) -> ModelInfo:
         qualname=qualname,
         docstring=docstring,
         field_names=field_names,
-        computed_field_names=tuple(computed_field_names),
-        validator_names=tuple(validator_names),
-        model_validator_names=tuple(model_validator_names),
+        computed_field_names=computed_field_names,
+        validator_names=validator_names,
+        model_validator_names=model_validator_names,
+        all_validator_names=validator_names + model_validator_names,
         model=model,
         is_root_model=is_root_model(model),
     )
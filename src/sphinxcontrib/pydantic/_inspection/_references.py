@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from pydantic import BaseModel
 
 #: Display name for model validators that validate the entire model.
@@ -34,6 +38,24 @@ class ValidatorFieldMap:
     validator_ref: str
 
 
+#: Validator-field mappings per model class. Both the class docstring and every
+#: field attribute of a model need them; weak keys let models created on the fly
+#: be garbage collected.
+_MAPPINGS_CACHE: WeakKeyDictionary[type, tuple[ValidatorFieldMap, ...]] = (
+    WeakKeyDictionary()
+)
+
+#: Per-field mappings, sorted by validator name, per model class.
+_FIELD_MAPPINGS_CACHE: WeakKeyDictionary[
+    type, dict[str, tuple[ValidatorFieldMap, ...]]
+] = WeakKeyDictionary()
+
+#: Path of the class defining each annotated field name, per model class.
+_FIELD_CLASS_PATHS_CACHE: WeakKeyDictionary[type, dict[str, str]] = WeakKeyDictionary()
+
+_BY_VALIDATOR_NAME = attrgetter("validator_name")
+
+
 def get_defining_class_path(func: object, model: type[BaseModel]) -> str:
     """Get the full path to the class where a method was defined.
 
@@ -56,7 +78,7 @@ def get_defining_class_path(func: object, model: type[BaseModel]) -> str:
 
     if qualname and "." in qualname:
         # Extract class name from qualname like "ClassName.method_name"
-        class_name = qualname.rsplit(".", 1)[0]
+        class_name = qualname.rpartition(".")[0]
         return f"{module}.{class_name}"
 
     # Fallback to the model being documented
@@ -80,21 +102,53 @@ def get_field_defining_class_path(field_name: str, model: type[BaseModel]) -> st
     str
         Full path like 'module.ClassName'.
     """
-    # Walk the MRO to find where this field was first defined
-    for cls in model.__mro__:
-        if not hasattr(cls, "model_fields"):
-            continue
-        # Check if this class directly defines the field (not inherited)
-        if field_name in cls.__annotations__:
-            return f"{cls.__module__}.{cls.__name__}"
+    class_path = _get_field_class_paths(model).get(field_name)
+    if class_path is not None:
+        return class_path
 
     # Fallback to the model being documented
     return f"{model.__module__}.{model.__name__}"
 
 
-def get_validator_field_mappings(model: type[BaseModel]) -> list[ValidatorFieldMap]:
+def _get_field_class_paths(model: type[BaseModel]) -> dict[str, str]:
+    """Map every annotated field name to the class defining it.
+
+    The MRO is walked once per model class and the result is cached; the first
+    class in the MRO annotating a name wins.
+
+    Parameters
+    ----------
+    model : type[BaseModel]
+        The model class.
+
+    Returns
+    -------
+    dict[str, str]
+        Full path like 'module.ClassName' per field name.
+    """
+    try:
+        return _FIELD_CLASS_PATHS_CACHE[model]
+    except KeyError:
+        pass
+    class_paths: dict[str, str] = {}
+    for cls in model.__mro__:
+        if not hasattr(cls, "model_fields"):
+            continue
+        class_path = f"{cls.__module__}.{cls.__name__}"
+        # Only names the class directly annotates (not inherited)
+        for name in cls.__annotations__:
+            class_paths.setdefault(name, class_path)
+    _FIELD_CLASS_PATHS_CACHE[model] = class_paths
+    return class_paths
+
+
+def get_validator_field_mappings(
+    model: type[BaseModel],
+) -> tuple[ValidatorFieldMap, ...]:
     """Generate all validator-field mappings for a model.
 
+    The mappings are computed once per model class and cached.
+
     Parameters
     ----------
     model : type[BaseModel]
@@ -102,33 +156,49 @@ def get_validator_field_mappings(model: type[BaseModel]) -> list[ValidatorFieldM
 
     Returns
     -------
-    list[ValidatorFieldMap]
-        List of all validator-field mappings.
+    tuple[ValidatorFieldMap, ...]
+        All validator-field mappings.
     """
+    try:
+        return _MAPPINGS_CACHE[model]
+    except KeyError:
+        pass
+    mappings = tuple(_build_validator_field_mappings(model))
+    _MAPPINGS_CACHE[model] = mappings
+    return mappings
+
+
+def _build_validator_field_mappings(
+    model: type[BaseModel],
+) -> list[ValidatorFieldMap]:
+    """Walk the validator decorators of a model and build its mappings."""
     mappings: list[ValidatorFieldMap] = []
     decorators = model.__pydantic_decorators__
     model_path = f"{model.__module__}.{model.__name__}"
 
+    field_class_paths = _get_field_class_paths(model)
+
     # Field validators
     for validator_name, validator_decorator in decorators.field_validators.items():
         # Get the class where the validator was defined
         validator_class_path = get_defining_class_path(validator_decorator.func, model)
+        validator_ref = f"{validator_class_path}.{validator_name}"
 
         for field in validator_decorator.info.fields:
-            field_name = ASTERISK_FIELD_NAME if field == "*" else field
-
-            # Get the class where the field was defined
-            if field_name == ASTERISK_FIELD_NAME:
+            if field == "*":
+                field_name = ASTERISK_FIELD_NAME
                 field_class_path = model_path
             else:
-                field_class_path = get_field_defining_class_path(field_name, model)
+                # Get the class where the field was defined
+                field_name = field
+                field_class_path = field_class_paths.get(field_name, model_path)
 
             mappings.append(
                 ValidatorFieldMap(
                     field_name=field_name,
                     validator_name=validator_name,
                     field_ref=f"{field_class_path}.{field_name}",
-                    validator_ref=f"{validator_class_path}.{validator_name}",
+                    validator_ref=validator_ref,
                 )
             )
 
@@ -148,14 +218,14 @@ def get_validator_field_mappings(model: type[BaseModel]) -> list[ValidatorFieldM
 
 
 def filter_mappings_by_validator(
-    mappings: list[ValidatorFieldMap],
+    mappings: Sequence[ValidatorFieldMap],
     validator_name: str,
 ) -> list[ValidatorFieldMap]:
     """Filter mappings to those for a specific validator.
 
     Parameters
     ----------
-    mappings : list[ValidatorFieldMap]
+    mappings : Sequence[ValidatorFieldMap]
         The mappings to filter.
     validator_name : str
         The validator name to filter by.
@@ -169,7 +239,7 @@ def filter_mappings_by_validator(
 
 
 def filter_mappings_by_field(
-    mappings: list[ValidatorFieldMap],
+    mappings: Sequence[ValidatorFieldMap],
     field_name: str,
 ) -> list[ValidatorFieldMap]:
     """Filter mappings to those for a specific field.
@@ -178,7 +248,7 @@ def filter_mappings_by_field(
 
     Parameters
     ----------
-    mappings : list[ValidatorFieldMap]
+    mappings : Sequence[ValidatorFieldMap]
         The mappings to filter.
     field_name : str
         The field name to filter by.
@@ -189,3 +259,38 @@ def filter_mappings_by_field(
         Mappings where field_name matches or is "all fields".
     """
     return [m for m in mappings if m.field_name in (field_name, ASTERISK_FIELD_NAME)]
+
+
+def get_field_validator_mappings(
+    model: type[BaseModel],
+    field_name: str,
+) -> tuple[ValidatorFieldMap, ...]:
+    """Get the mappings of the validators that apply to a field.
+
+    Includes model validators (which apply to "all fields"). The per-field
+    mappings of a model are computed and sorted once, then cached.
+
+    Parameters
+    ----------
+    model : type[BaseModel]
+        The Pydantic model class.
+    field_name : str
+        The field name.
+
+    Returns
+    -------
+    tuple[ValidatorFieldMap, ...]
+        Mappings where field_name matches or is "all fields", sorted by
+        validator name.
+    """
+    try:
+        index = _FIELD_MAPPINGS_CACHE[model]
+    except KeyError:
+        mappings = sorted(get_validator_field_mappings(model), key=_BY_VALIDATOR_NAME)
+        names = {m.field_name for m in mappings} | {ASTERISK_FIELD_NAME}
+        index = {
+            name: tuple(filter_mappings_by_field(mappings, name)) for name in names
+        }
+        _FIELD_MAPPINGS_CACHE[model] = index
+    # Fields without a dedicated validator are only covered by model validators
+    return index.get(field_name, index[ASTERISK_FIELD_NAME])
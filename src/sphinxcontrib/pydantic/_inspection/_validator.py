@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 from sphinxcontrib.pydantic._inspection._model import is_pydantic_model
@@ -45,9 +46,18 @@ class ValidatorInfo:
     field_class_paths: dict[str, str]
 
 
+#: ValidatorInfo per model class and validator name. Weak keys let models created
+#: on the fly be garbage collected.
+_VALIDATOR_INFO_CACHE: WeakKeyDictionary[type, dict[str, ValidatorInfo]] = (
+    WeakKeyDictionary()
+)
+
+
 def get_validator_info(model: type[BaseModel], validator_name: str) -> ValidatorInfo:
     """Extract information about a specific validator from a Pydantic model.
 
+    The result is cached per model class and validator name.
+
     Parameters
     ----------
     model : type[BaseModel]
@@ -70,19 +80,26 @@ def get_validator_info(model: type[BaseModel], validator_name: str) -> Validator
     if not is_pydantic_model(model):
         raise TypeError(f"{model!r} is not a Pydantic model class.")
 
+    try:
+        return _VALIDATOR_INFO_CACHE[model][validator_name]
+    except KeyError:
+        pass
+
     decorators = model.__pydantic_decorators__
 
     # Check field validators first
     if validator_name in decorators.field_validators:
-        return _get_field_validator_info(model, validator_name, decorators)
-
+        info = _get_field_validator_info(model, validator_name, decorators)
     # Check model validators
-    if validator_name in decorators.model_validators:
-        return _get_model_validator_info(model, validator_name, decorators)
-
-    raise KeyError(
-        f"Validator '{validator_name}' does not exist in model {model.__name__}"
-    )
+    elif validator_name in decorators.model_validators:
+        info = _get_model_validator_info(model, validator_name, decorators)
+    else:
+        raise KeyError(
+            f"Validator '{validator_name}' does not exist in model {model.__name__}"
+        )
+
+    _VALIDATOR_INFO_CACHE.setdefault(model, {})[validator_name] = info
+    return info
 
 
 def _get_field_validator_info(
@@ -9,8 +9,10 @@ from sphinxcontrib.pydantic._rendering._rst import (
     format_default_value,
     format_type_annotation,
     generate_json_schema_block,
+    render_json_schema,
 )
 from sphinxcontrib.pydantic._rendering._summary import (
+    BY_NAME,
     create_role_reference,
     generate_field_summary_table,
     generate_root_type_line,
@@ -8,8 +8,9 @@ options.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
@@ -73,9 +74,36 @@ class GeneratorConfig:
     hide_paramlist: bool
 
 
+#: GeneratorConfig per Sphinx config object and prefix. Config values are fixed
+#: once the build has started, so each snapshot is only built once.
+_SPHINX_CONFIG_CACHE: WeakKeyDictionary[Any, dict[str, GeneratorConfig]] = (
+    WeakKeyDictionary()
+)
+
+
+#: GeneratorConfig attribute overridden by each directive option.
+_DIRECTIVE_OPTIONS: dict[str, str] = {
+    "show-field-summary": "show_field_summary",
+    "show-validator-summary": "show_validator_summary",
+    "show-json": "show_json",
+    "show-members": "show_members",
+    "show-alias": "field_show_alias",
+    "show-default": "field_show_default",
+    "show-required": "field_show_required",
+    "show-constraints": "field_show_constraints",
+    "list-fields": "validator_list_fields",
+    "show-private-members": "show_private_members",
+    "signature-prefix": "signature_prefix",
+    "hide-paramlist": "hide_paramlist",
+}
+
+
 def config_from_sphinx(app: Sphinx, prefix: str = "model") -> GeneratorConfig:
     """Create GeneratorConfig from Sphinx application config.
 
+    The result is cached per Sphinx config object and prefix, as autodoc
+    requests it for every documented model and field.
+
     Parameters
     ----------
     app : Sphinx
@@ -88,20 +116,42 @@ def config_from_sphinx(app: Sphinx, prefix: str = "model") -> GeneratorConfig:
     GeneratorConfig
         Configuration populated from Sphinx config values.
     """
+    return _config_from_sphinx_config(app.config, prefix)
+
+
+def _config_from_sphinx_config(sphinx_config: Any, prefix: str) -> GeneratorConfig:
+    """Create and cache the GeneratorConfig of a Sphinx config object.
+
+    Parameters
+    ----------
+    sphinx_config : Any
+        Sphinx config object.
+    prefix : str
+        Config prefix: "model" or "settings".
+
+    Returns
+    -------
+    GeneratorConfig
+        Configuration populated from Sphinx config values.
+    """
+    try:
+        return _SPHINX_CONFIG_CACHE[sphinx_config][prefix]
+    except KeyError:
+        pass
 
     def get(name: str, default: Any) -> Any:
         full_name = f"sphinxcontrib_pydantic_{prefix}_{name}"
-        return getattr(app.config, full_name, default)
+        return getattr(sphinx_config, full_name, default)
 
     def get_field(name: str, default: Any) -> Any:
         full_name = f"sphinxcontrib_pydantic_field_{name}"
-        return getattr(app.config, full_name, default)
+        return getattr(sphinx_config, full_name, default)
 
     def get_validator(name: str, default: Any) -> Any:
         full_name = f"sphinxcontrib_pydantic_validator_{name}"
-        return getattr(app.config, full_name, default)
+        return getattr(sphinx_config, full_name, default)
 
-    return GeneratorConfig(
+    config = GeneratorConfig(
         show_field_summary=get("show_field_summary", True),
         show_validator_summary=get("show_validator_summary", True),
         show_json=get("show_json", False),
@@ -115,6 +165,8 @@ def config_from_sphinx(app: Sphinx, prefix: str = "model") -> GeneratorConfig:
         signature_prefix=get("signature_prefix", prefix),
         hide_paramlist=get("hide_paramlist", True),
     )
+    _SPHINX_CONFIG_CACHE.setdefault(sphinx_config, {})[prefix] = config
+    return config
 
 
 def config_from_directive(
@@ -124,6 +176,9 @@ def config_from_directive(
 ) -> GeneratorConfig:
     """Create GeneratorConfig from directive options with Sphinx config fallback.
 
+    Only the options set on the directive are looked up; every other value comes
+    from the cached configuration of ``sphinx_config``.
+
     Parameters
     ----------
     options : dict[str, Any]
@@ -138,44 +193,11 @@ def config_from_directive(
     GeneratorConfig
         Configuration populated from options with config fallback.
     """
-
-    def get(option_name: str, config_suffix: str, default: Any) -> Any:
-        # Check directive option first
-        if option_name in options:
-            value = options[option_name]
-            # Handle flag options (None means True)
-            return True if value is None else value
-        # Fall back to Sphinx config
-        full_name = f"sphinxcontrib_pydantic_{prefix}_{config_suffix}"
-        return getattr(sphinx_config, full_name, default)
-
-    def get_field(option_name: str, config_suffix: str, default: Any) -> Any:
-        if option_name in options:
-            value = options[option_name]
-            return True if value is None else value
-        full_name = f"sphinxcontrib_pydantic_field_{config_suffix}"
-        return getattr(sphinx_config, full_name, default)
-
-    def get_validator(option_name: str, config_suffix: str, default: Any) -> Any:
-        if option_name in options:
-            value = options[option_name]
-            return True if value is None else value
-        full_name = f"sphinxcontrib_pydantic_validator_{config_suffix}"
-        return getattr(sphinx_config, full_name, default)
-
-    return GeneratorConfig(
-        show_field_summary=get("show-field-summary", "show_field_summary", True),
-        show_validator_summary=get(
-            "show-validator-summary", "show_validator_summary", True
-        ),
-        show_json=get("show-json", "show_json", False),
-        show_members=get("show-members", "show_members", True),
-        field_show_alias=get_field("show-alias", "show_alias", True),
-        field_show_default=get_field("show-default", "show_default", True),
-        field_show_required=get_field("show-required", "show_required", True),
-        field_show_constraints=get_field("show-constraints", "show_constraints", True),
-        validator_list_fields=get_validator("list-fields", "list_fields", True),
-        show_private_members=get("show-private-members", "show_private_members", False),
-        signature_prefix=get("signature-prefix", "signature_prefix", prefix),
-        hide_paramlist=get("hide-paramlist", "hide_paramlist", True),
-    )
+    config = _config_from_sphinx_config(sphinx_config, prefix)
+    overrides = {
+        # Flag options have a None value, which means True
+        attribute: True if value is None else value
+        for option, value in options.items()
+        if (attribute := _DIRECTIVE_OPTIONS.get(option)) is not None
+    }
+    return replace(config, **overrides) if overrides else config
@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import json
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
+from sphinx.util import logging
 from sphinx.util.typing import restify, stringify_annotation
 
 if TYPE_CHECKING:
     from typing import Any
 
+_logger = logging.getLogger(__name__)
+
+#: Serialized JSON schema per model class. Weak keys let models created on the fly
+#: (e.g. parametrized generics) be garbage collected.
+_JSON_SCHEMA_CACHE: WeakKeyDictionary[type, str] = WeakKeyDictionary()
+
 
 def format_type_annotation(annotation: Any, *, as_rst: bool = False) -> str:
     """Format a type annotation for display.
@@ -61,6 +69,32 @@ def format_default_value(value: Any) -> str:
     return repr(value)
 
 
+def render_json_schema(model: type) -> str:
+    """Serialize the JSON schema of a model with a 2-space indent.
+
+    ``model_json_schema()`` walks the whole core schema on every call, so the
+    serialized result is cached per model class. Failures are not cached, as a
+    later ``model_rebuild()`` can fix them.
+
+    Parameters
+    ----------
+    model : type
+        The Pydantic model class.
+
+    Returns
+    -------
+    str
+        The JSON schema of the model.
+    """
+    try:
+        return _JSON_SCHEMA_CACHE[model]
+    except KeyError:
+        pass
+    schema_str = json.dumps(model.model_json_schema(), indent=2)
+    _JSON_SCHEMA_CACHE[model] = schema_str
+    return schema_str
+
+
 def generate_json_schema_block(model: type) -> list[str]:
     """Generate RST lines for a JSON schema code block.
 
@@ -75,13 +109,16 @@ def generate_json_schema_block(model: type) -> list[str]:
         RST lines for the JSON schema block, or empty list on error.
     """
     try:
-        schema = model.model_json_schema()
-        schema_str = json.dumps(schema, indent=2)
+        schema_str = render_json_schema(model)
 
         lines = ["", "**JSON Schema:**", "", ".. code-block:: json", ""]
         # Indent each line of the schema for the code block
         lines.extend(f"   {line}" for line in schema_str.split("\n"))
         lines.append("")
         return lines
-    except Exception:
+    except Exception as e:
+        # Schema generation runs user code (e.g. __get_pydantic_json_schema__), so
+        # any error only skips the schema block instead of aborting the build; it is
+        # logged at debug level so that -W builds keep passing
+        _logger.debug("Failed to generate JSON schema for %s: %s", model, e)
         return []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from sphinxcontrib.pydantic._rendering._rst import (
@@ -10,8 +11,13 @@ from sphinxcontrib.pydantic._rendering._rst import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sphinxcontrib.pydantic._inspection import FieldInfo, ValidatorInfo
 
+# Sort key for fields and validators
+BY_NAME = attrgetter("name")
+
 
 def create_role_reference(name: str, target: str, role: str = "py:obj") -> str:
     """Create RST role syntax for a cross-reference.
@@ -41,7 +47,7 @@ def create_role_reference(name: str, target: str, role: str = "py:obj") -> str:
 
 
 def generate_field_summary_table(
-    fields: list[FieldInfo],
+    fields: Sequence[FieldInfo],
     model_path: str,
     *,
     show_alias: bool = True,
@@ -53,7 +59,7 @@ def generate_field_summary_table(
 
     Parameters
     ----------
-    fields : list[FieldInfo]
+    fields : Sequence[FieldInfo]
         The fields to include in the summary.
     model_path : str
         The fully qualified model path (e.g., "module.Class").
@@ -75,8 +81,8 @@ def generate_field_summary_table(
     if not fields:
         return []
 
-    # Sort fields alphabetically by name
-    fields = sorted(fields, key=lambda f: f.name)
+    # Sort fields alphabetically by name (linear if they already are)
+    fields = sorted(fields, key=BY_NAME)
 
     lines: list[str] = []
 
@@ -208,7 +214,7 @@ def generate_root_type_line(root_field: FieldInfo) -> list[str]:
 
 
 def generate_validator_summary_table(
-    validators: list[ValidatorInfo],
+    validators: Sequence[ValidatorInfo],
     model_path: str,
     *,
     list_fields: bool = True,
@@ -217,7 +223,7 @@ def generate_validator_summary_table(
 
     Parameters
     ----------
-    validators : list[ValidatorInfo]
+    validators : Sequence[ValidatorInfo]
         The validators to include in the summary.
     model_path : str
         The fully qualified model path (e.g., "module.Class").
@@ -233,8 +239,8 @@ def generate_validator_summary_table(
     if not validators:
         return []
 
-    # Sort validators alphabetically by name
-    validators = sorted(validators, key=lambda v: v.name)
+    # Sort validators alphabetically by name (linear if they already are)
+    validators = sorted(validators, key=BY_NAME)
 
     lines: list[str] = []
 
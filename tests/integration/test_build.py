@@ -458,6 +458,48 @@ class TestBuildWarnings:
         else:
             raise AssertionError("SimpleModel not found in output")
 
+    def test_model_hide_paramlist_wins_over_later_listener(
+        self,
+        make_app: Callable[..., SphinxTestApp],
+        tmp_path: Path,
+        parse_html: Callable[[str], BeautifulSoup],
+    ) -> None:
+        """Test that a signature listener connected later does not take over."""
+        srcdir = tmp_path / "src"
+        srcdir.mkdir()
+
+        (srcdir / "conf.py").write_text(
+            'extensions = ["sphinx.ext.autodoc", "sphinxcontrib.pydantic"]\n'
+            'project = "Test"\n'
+            'exclude_patterns = ["_build"]\n'
+            "\n"
+            "def _other(app, what, name, obj, options, signature, ret):\n"
+            '    return ("(OTHER)", ret) if what == "class" else None\n'
+            "\n"
+            "def setup(app):\n"
+            '    app.connect("autodoc-process-signature", _other)\n'
+        )
+        (srcdir / "index.rst").write_text(
+            "Test Project\n"
+            "============\n"
+            "\n"
+            ".. autoclass:: tests.assets.models.basic.SimpleModel\n"
+        )
+
+        app = make_app(srcdir=srcdir)
+        app.build()
+
+        outdir = Path(app.outdir)
+        soup = parse_html((outdir / "index.html").read_text(encoding="utf-8"))
+
+        for sig in soup.select("dt.sig"):
+            name_span = sig.select_one("span.sig-name.descname")
+            if name_span and name_span.get_text(strip=True) == "SimpleModel":
+                assert "OTHER" not in sig.get_text()
+                break
+        else:
+            raise AssertionError("SimpleModel not found in output")
+
     def test_settings_hide_paramlist_true_no_warnings(
         self,
         make_app: Callable[..., SphinxTestApp],
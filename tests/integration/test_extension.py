@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from pathlib import Path
 
 from docutils.parsers.rst import directives
 from sphinx.testing.util import SphinxTestApp
@@ -125,6 +126,32 @@ class TestConfigRegistration:
             app.config.sphinxcontrib_pydantic_model_signature_prefix == "pydantic model"
         )
 
+    def test_boolean_config_accepts_int(
+        self, make_app: Callable[..., SphinxTestApp], tmp_path: Path
+    ) -> None:
+        """Test that a 0/1 value of a boolean option is accepted and honoured."""
+        srcdir = tmp_path / "src"
+        srcdir.mkdir()
+        (srcdir / "conf.py").write_text(
+            'extensions = ["sphinx.ext.autodoc", "sphinxcontrib.pydantic"]\n'
+            'project = "Test"\n'
+            'exclude_patterns = ["_build"]\n'
+        )
+        (srcdir / "index.rst").write_text(
+            "Test\n====\n\n.. autoclass:: tests.assets.models.basic.SimpleModel\n"
+        )
+
+        app = make_app(
+            srcdir=srcdir,
+            confoverrides={"sphinxcontrib_pydantic_model_show_json": 1},
+        )
+        app.build()
+
+        assert app.statuscode == 0
+        assert "sphinxcontrib_pydantic_model_show_json" not in app.warning.getvalue()
+        html = (Path(app.outdir) / "index.html").read_text(encoding="utf-8")
+        assert "JSON Schema" in html
+
 
 class TestDirectiveRegistration:
     """Tests for directive registration."""
@@ -191,3 +218,13 @@ class TestAutodocHandlerRegistration:
 
         handler_names = [listener.handler.__name__ for listener in listeners]
         assert "autodoc_process_docstring" in handler_names
+
+    def test_autodoc_process_signature_handler_registered(
+        self, make_app: Callable[..., SphinxTestApp]
+    ) -> None:
+        """Test that autodoc-process-signature handler is registered."""
+        app = make_app()
+
+        listeners = app.events.listeners.get("autodoc-process-signature", [])
+        handler_names = [listener.handler.__name__ for listener in listeners]
+        assert "autodoc_process_signature" in handler_names
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+from pydantic import BaseModel
+
 from sphinxcontrib.pydantic._autodoc._handlers import (
     _PYDANTIC_BASE_CLASSES,
     PYDANTIC_SKIP_MEMBERS,
     _process_attribute_docstring,
+    _process_class_docstring,
     is_pydantic_base_member,
     is_pydantic_internal,
     should_skip_member,
@@ -247,9 +251,64 @@ class TestPydanticSkipMembers:
         assert expected_members <= PYDANTIC_SKIP_MEMBERS
 
 
+class TestProcessClassDocstring:
+    """Tests for _process_class_docstring function."""
+
+    def test_skips_json_schema_of_base_model(self) -> None:
+        """Test that BaseModel itself, reached via an import, gets no schema."""
+        app = MagicMock()
+        app.config.sphinxcontrib_pydantic_model_show_json = True
+
+        lines: list[str] = []
+        _process_class_docstring(
+            app=app, name="mymod.BaseModel", obj=BaseModel, options={}, lines=lines
+        )
+
+        assert "**JSON Schema:**" not in lines
+
+    def test_adds_json_schema_of_model(self) -> None:
+        """Test that the JSON schema is added for a regular model."""
+        app = MagicMock()
+        app.config.sphinxcontrib_pydantic_model_show_json = True
+
+        lines: list[str] = []
+        _process_class_docstring(
+            app=app,
+            name="tests.assets.models.basic.SimpleModel",
+            obj=SimpleModel,
+            options={},
+            lines=lines,
+        )
+
+        assert "**JSON Schema:**" in lines
+
+
 class TestProcessAttributeDocstring:
     """Tests for _process_attribute_docstring function."""
 
+    def test_skips_module_raising_attribute_error_on_import(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a module failing with AttributeError on import is skipped."""
+
+        def import_module(name: str) -> None:
+            raise AttributeError("broken module")
+
+        monkeypatch.setattr(
+            "sphinxcontrib.pydantic._autodoc._handlers.import_module", import_module
+        )
+
+        lines = ["Existing docstring."]
+        _process_attribute_docstring(
+            app=MagicMock(),
+            name="not_a_loaded_module.Model.field",
+            obj=None,
+            options={},
+            lines=lines,
+        )
+
+        assert lines == ["Existing docstring."]
+
     def test_adds_description_when_docstring_empty(self) -> None:
         """Test that field description is added when docstring is empty."""
         app = MagicMock()
@@ -105,6 +105,17 @@ class TestProcessDocstring:
         assert result == ["Test docstring."]
         mock_app.emit.assert_not_called()
 
+    def test_fallback_when_event_has_no_listeners(self) -> None:
+        """Returns raw lines when the event is registered but unused."""
+        mock_app = MagicMock()
+        mock_app.events.events = {"autodoc-process-docstring": ""}
+        mock_app.events.listeners = {}
+
+        result = process_docstring(mock_app, "Line one.\r\nLine two.")
+
+        assert result == ["Line one.", "Line two."]
+        mock_app.emit.assert_not_called()
+
 
 class TestProcessDocstringWithNumpydoc:
     """Tests for docstring processing with numpydoc extension."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 from docutils.parsers.rst import directives
 from sphinx.domains.python import PyAttribute
 
@@ -40,3 +41,8 @@ class TestPydanticFieldDirective:
         # Ensure we didn't accidentally modify the parent class
         assert "required" not in PyAttribute.option_spec
         assert "optional" not in PyAttribute.option_spec
+
+    def test_option_spec_is_read_only(self) -> None:
+        """Directive option_spec can not be mutated in place."""
+        with pytest.raises(TypeError):
+            PydanticFieldDirective.option_spec["new"] = directives.flag
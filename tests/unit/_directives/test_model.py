@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 from docutils.parsers.rst import directives
 
 from sphinxcontrib.pydantic._directives import (
@@ -10,6 +11,11 @@ from sphinxcontrib.pydantic._directives import (
     PydanticModelDirective,
     flag_or_value,
 )
+from sphinxcontrib.pydantic._directives._model import (
+    _clear_import_cache,
+    _import_object,
+)
+from tests.assets.models.basic import SimpleModel
 
 
 class TestPydanticModelDirective:
@@ -96,6 +102,11 @@ class TestPydanticModelDirective:
         spec = PydanticModelDirective.option_spec
         assert spec["hide-paramlist"] == flag_or_value
 
+    def test_option_spec_is_read_only(self) -> None:
+        """Directive option_spec cannot be mutated."""
+        with pytest.raises(TypeError):
+            PydanticModelDirective.option_spec["extra"] = flag_or_value
+
 
 class TestAutoPydanticModelDirective:
     """Tests for the AutoPydanticModelDirective class."""
@@ -107,3 +118,25 @@ class TestAutoPydanticModelDirective:
     def test_inherits_from_model_directive(self) -> None:
         """AutoPydanticModelDirective inherits from PydanticModelDirective."""
         assert issubclass(AutoPydanticModelDirective, PydanticModelDirective)
+
+
+class TestImportObject:
+    """Tests for the cached model import helper."""
+
+    def test_imports_model(self) -> None:
+        """Helper resolves a model from its fully qualified path."""
+        assert _import_object("tests.assets.models.basic.SimpleModel") is SimpleModel
+
+    def test_missing_objects_return_none(self) -> None:
+        """Helper returns None for unknown modules and attributes."""
+        assert _import_object("tests.assets.models.nonexistent.Model") is None
+        assert _import_object("tests.assets.models.basic.Nonexistent") is None
+
+    def test_cache_cleared_on_build_finished(self) -> None:
+        """Cached imports are dropped by the build-finished handler."""
+        _import_object("tests.assets.models.basic.SimpleModel")
+        assert _import_object.cache_info().currsize > 0
+
+        _clear_import_cache(None, None)
+
+        assert _import_object.cache_info().currsize == 0
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from sphinxcontrib.pydantic._directives import (
     AutoPydanticSettingsDirective,
     PydanticDirective,
     PydanticModelDirective,
     PydanticSettingsDirective,
 )
+from tests.assets.models.basic import SimpleModel
+from tests.assets.models.settings import SimpleSettings
 
 
 class TestPydanticSettingsDirective:
@@ -24,7 +28,13 @@ class TestPydanticSettingsDirective:
     def test_has_option_spec(self) -> None:
         """Test that directive has option_spec."""
         assert hasattr(PydanticSettingsDirective, "option_spec")
-        assert isinstance(PydanticSettingsDirective.option_spec, dict)
+        assert isinstance(PydanticSettingsDirective.option_spec, Mapping)
+
+    def test_shares_model_option_spec(self) -> None:
+        """Test that the settings directive reuses the model option_spec."""
+        assert PydanticSettingsDirective.option_spec is (
+            PydanticModelDirective.option_spec
+        )
 
     def test_inherits_model_options(self) -> None:
         """Test that settings directive inherits model options."""
@@ -49,6 +59,17 @@ class TestPydanticSettingsDirective:
         """Test that directive has members option."""
         assert "members" in PydanticSettingsDirective.option_spec
 
+    def test_check_model_accepts_only_settings(self) -> None:
+        """Test that the settings directive only accepts settings classes."""
+        settings_directive = PydanticSettingsDirective.__new__(
+            PydanticSettingsDirective
+        )
+        model_directive = PydanticModelDirective.__new__(PydanticModelDirective)
+
+        assert settings_directive._check_model(SimpleSettings) is True
+        assert settings_directive._check_model(SimpleModel) is False
+        assert model_directive._check_model(SimpleModel) is True
+
 
 class TestAutoPydanticSettingsDirective:
     """Tests for AutoPydanticSettingsDirective class."""
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Annotated
+
 import pytest
+from pydantic import BaseModel
 
-from sphinxcontrib.pydantic._inspection import FieldInfo, get_field_info
+from sphinxcontrib.pydantic._inspection import (
+    FieldInfo,
+    get_all_field_info,
+    get_field_info,
+)
 from tests.assets.models.basic import DocumentedModel, SimpleModel
 from tests.assets.models.fields import (
     FieldWithAlias,
@@ -64,6 +71,54 @@ class TestGetFieldInfo:
         with pytest.raises(TypeError, match="not a Pydantic model"):
             get_field_info(NotAModel, "field")
 
+    def test_result_is_cached_per_field(self) -> None:
+        """Test that repeated calls return the same cached FieldInfo."""
+        info = get_field_info(SimpleModel, "name")
+
+        assert get_field_info(SimpleModel, "name") is info
+
+    def test_incomplete_model_is_not_cached(self) -> None:
+        """Test that models with unresolved forward references are not cached."""
+
+        class Incomplete(BaseModel):
+            item: Undefined  # noqa: F821
+
+        assert Incomplete.__pydantic_complete__ is False
+        info = get_field_info(Incomplete, "item")
+
+        assert get_field_info(Incomplete, "item") is not info
+
+
+class TestGetAllFieldInfo:
+    """Tests for get_all_field_info function."""
+
+    def test_returns_fields_in_definition_order(self) -> None:
+        """Test that every field is returned in definition order."""
+        fields = get_all_field_info(SimpleModel)
+
+        assert [f.name for f in fields] == list(SimpleModel.model_fields)
+
+    def test_reuses_per_field_info(self) -> None:
+        """Test that entries are the same objects as get_field_info returns."""
+        fields = get_all_field_info(SimpleModel)
+
+        assert fields[0] is get_field_info(SimpleModel, fields[0].name)
+
+    def test_result_is_cached_per_model(self) -> None:
+        """Test that repeated calls return the same cached tuple."""
+        fields = get_all_field_info(SimpleModel)
+
+        assert get_all_field_info(SimpleModel) is fields
+
+    def test_raises_for_non_pydantic_model(self) -> None:
+        """Test that TypeError is raised for non-Pydantic models."""
+
+        class NotAModel:
+            pass
+
+        with pytest.raises(TypeError, match="not a Pydantic model"):
+            get_all_field_info(NotAModel)
+
 
 class TestFieldInfoAlias:
     """Tests for field alias extraction."""
@@ -143,6 +198,39 @@ class TestFieldInfoConstraints:
         # Verify exact constraints dictionary, not just individual values
         assert info.constraints == {"ge": 0, "le": 100}
 
+    def test_extracts_instance_and_class_attributes(self) -> None:
+        """Test that custom metadata attributes are read wherever they are set."""
+
+        class Custom:
+            strict = None
+
+            def __init__(self) -> None:
+                self.max_digits = 5
+                self.unrelated = 1
+
+        class Model(BaseModel):
+            value: Annotated[int, Custom()]
+
+        info = get_field_info(Model, "value")
+
+        assert info.constraints == {"max_digits": 5}
+
+    def test_extracts_attributes_from_getattr(self) -> None:
+        """Test that constraints served by __getattr__ are extracted."""
+
+        class Dynamic:
+            def __getattr__(self, name: str) -> int:
+                if name == "ge":
+                    return 5
+                raise AttributeError(name)
+
+        class Model(BaseModel):
+            value: Annotated[int, Dynamic()]
+
+        info = get_field_info(Model, "value")
+
+        assert info.constraints == {"ge": 5}
+
 
 class TestFieldInfoDefaultFactory:
     """Tests for field default_factory extraction."""
@@ -192,3 +280,10 @@ class TestFieldInfo:
         info = get_field_info(FieldWithMetadata, "example_field")
 
         assert info.examples == ["example1", "example2"]
+
+    def test_examples_list_is_not_copied(self) -> None:
+        """Test that a list of examples is shared with the Pydantic field."""
+        info = get_field_info(FieldWithMetadata, "example_field")
+        pydantic_field = FieldWithMetadata.model_fields["example_field"]
+
+        assert info.examples is pydantic_field.examples
@@ -162,6 +162,15 @@ class TestModelInfo:
 
         assert set(info.model_validator_names) == {"passwords_match"}
 
+    def test_all_validator_names_combines_field_and_model_validators(self) -> None:
+        """Test that all_validator_names lists field then model validators."""
+        assert get_model_info(SingleFieldValidator).all_validator_names == (
+            "check_positive",
+        )
+        assert get_model_info(ModelValidatorAfter).all_validator_names == (
+            "passwords_match",
+        )
+
 
 class TestIsPydanticSettings:
     """Tests for is_pydantic_settings function."""
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import BaseModel, field_validator, model_validator
 
 from sphinxcontrib.pydantic._inspection import (
     ASTERISK_FIELD_NAME,
     ValidatorFieldMap,
     filter_mappings_by_field,
     filter_mappings_by_validator,
+    get_field_validator_mappings,
     get_validator_field_mappings,
 )
+from sphinxcontrib.pydantic._inspection._references import (
+    get_field_defining_class_path,
+)
 from tests.assets.models.basic import SimpleModel
 from tests.assets.models.inheritance import (
     ChildModelSimple,
@@ -90,10 +95,16 @@ class TestGetValidatorFieldMappings:
         assert mapping.validator_name == "passwords_match"
 
     def test_model_with_no_validators(self) -> None:
-        """Test that models without validators return empty list."""
+        """Test that models without validators return no mappings."""
         mappings = get_validator_field_mappings(SimpleModel)
 
-        assert mappings == []
+        assert mappings == ()
+
+    def test_result_is_cached_per_model(self) -> None:
+        """Test that repeated calls return the same cached mappings."""
+        mappings = get_validator_field_mappings(SingleFieldValidator)
+
+        assert get_validator_field_mappings(SingleFieldValidator) is mappings
 
     def test_field_ref_format(self) -> None:
         """Test that field_ref has correct format."""
@@ -160,6 +171,46 @@ class TestFilterMappingsByField:
         assert filtered == []
 
 
+class TestGetFieldValidatorMappings:
+    """Tests for get_field_validator_mappings function."""
+
+    class _Model(BaseModel):
+        x: int
+        y: int
+
+        @field_validator("x")
+        @classmethod
+        def zeta(cls, v: int) -> int:
+            return v
+
+        @field_validator("x")
+        @classmethod
+        def alpha(cls, v: int) -> int:
+            return v
+
+        @model_validator(mode="after")
+        def middle(self) -> TestGetFieldValidatorMappings._Model:
+            return self
+
+    def test_sorted_by_validator_name(self) -> None:
+        """Test that field and model validators are merged and sorted."""
+        mappings = get_field_validator_mappings(self._Model, "x")
+
+        assert [m.validator_name for m in mappings] == ["alpha", "middle", "zeta"]
+
+    def test_field_without_validator_gets_model_validators(self) -> None:
+        """Test that a field without validators only gets model validators."""
+        mappings = get_field_validator_mappings(self._Model, "y")
+
+        assert [m.validator_name for m in mappings] == ["middle"]
+
+    def test_result_is_cached_per_field(self) -> None:
+        """Test that repeated calls return the same cached mappings."""
+        mappings = get_field_validator_mappings(self._Model, "x")
+
+        assert get_field_validator_mappings(self._Model, "x") is mappings
+
+
 class TestInheritanceScenarios:
     """Tests for validator mappings with inheritance."""
 
@@ -194,3 +245,17 @@ class TestInheritanceScenarios:
         assert "validate_base_field" in validator_names
         assert "validate_child_field" in validator_names
         assert "validate_grandchild" in validator_names
+
+    def test_field_defining_class_path(self) -> None:
+        """Test that a field resolves to the most derived class annotating it."""
+
+        class Base(BaseModel):
+            x: int = 0
+            y: int = 0
+
+        class Child(Base):
+            x: int = 1
+
+        assert get_field_defining_class_path("x", Child).endswith(".Child")
+        assert get_field_defining_class_path("y", Child).endswith(".Base")
+        assert get_field_defining_class_path("z", Child).endswith(".Child")
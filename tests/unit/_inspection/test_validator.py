@@ -39,6 +39,12 @@ class TestGetValidatorInfo:
 
         assert set(info.fields) == {"x", "y"}
 
+    def test_result_is_cached_per_validator(self) -> None:
+        """Test that repeated calls return the same cached ValidatorInfo."""
+        info = get_validator_info(SingleFieldValidator, "check_positive")
+
+        assert get_validator_info(SingleFieldValidator, "check_positive") is info
+
     def test_extracts_validator_mode(self) -> None:
         """Test that validator mode is extracted."""
         info = get_validator_info(BeforeValidator, "coerce_string")
@@ -162,6 +162,15 @@ class TestConfigFromSphinx:
         config = config_from_sphinx(app)
         assert config.validator_list_fields is False
 
+    def test_result_is_cached_per_config(self) -> None:
+        """Test that repeated calls reuse the snapshot for the same config."""
+        app = self._make_app()
+        config = config_from_sphinx(app)
+
+        assert config_from_sphinx(app) is config
+        assert config_from_sphinx(app, prefix="settings") is not config
+        assert config_from_sphinx(self._make_app()) is not config
+
 
 class TestConfigFromDirective:
     """Tests for config_from_directive factory function."""
@@ -257,3 +266,11 @@ class TestConfigFromDirective:
 
         config = config_from_directive(options, sphinx_config)
         assert config.hide_paramlist is False
+
+    def test_without_options_reuses_sphinx_config(self) -> None:
+        """Test that a directive without options reuses the cached config."""
+        sphinx_config = self._make_config()
+
+        config = config_from_directive({"noindex": None}, sphinx_config)
+        assert config_from_directive({}, sphinx_config) is config
+        assert config_from_directive({"show-json": None}, sphinx_config) is not config
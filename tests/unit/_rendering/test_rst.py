@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import json
+import logging
 from typing import Union
 
+import pytest
+from pydantic import BaseModel, PydanticUserError
+
 from sphinxcontrib.pydantic._rendering import (
     format_default_value,
     format_type_annotation,
     generate_json_schema_block,
+    render_json_schema,
 )
 from tests.assets.models.basic import DocumentedModel, SimpleModel
 
@@ -220,6 +226,38 @@ class TestFormatDefaultValue:
         assert format_default_value({}) == "{}"
 
 
+class TestRenderJsonSchema:
+    """Tests for render_json_schema function."""
+
+    def test_renders_indented_json(self) -> None:
+        """Test that the schema is serialized with a 2-space indent."""
+        schema_str = render_json_schema(SimpleModel)
+
+        assert json.loads(schema_str) == SimpleModel.model_json_schema()
+        assert '\n  "properties"' in schema_str
+
+    def test_result_is_cached_per_model(self) -> None:
+        """Test that repeated calls reuse the serialized schema."""
+        assert render_json_schema(SimpleModel) is render_json_schema(SimpleModel)
+        assert render_json_schema(SimpleModel) != render_json_schema(DocumentedModel)
+
+    def test_failure_is_retried_after_rebuild(self) -> None:
+        """Test that a model fixed by model_rebuild() renders its schema."""
+
+        class Parent(BaseModel):
+            child: Child  # noqa: F821
+
+        with pytest.raises(PydanticUserError):
+            render_json_schema(Parent)
+
+        class Child(BaseModel):
+            value: int
+
+        Parent.model_rebuild(_types_namespace={"Child": Child})
+
+        assert "Child" in json.loads(render_json_schema(Parent))["$defs"]
+
+
 class TestGenerateJsonSchemaBlock:
     """Tests for generate_json_schema_block function."""
 
@@ -269,3 +307,23 @@ class TestGenerateJsonSchemaBlock:
         # Should include field names from the model
         assert "name" in content
         assert "value" in content
+
+    def test_returns_empty_when_schema_hook_raises(self) -> None:
+        """Test that any error from user schema code skips the block."""
+
+        class UnsupportedModel(BaseModel):
+            value: int
+
+            @classmethod
+            def __get_pydantic_json_schema__(cls, core_schema, handler):
+                raise NotImplementedError("no schema")
+
+        assert generate_json_schema_block(UnsupportedModel) == []
+
+    def test_failure_does_not_warn(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a failing schema does not emit a warning."""
+        with caplog.at_level(logging.DEBUG):
+            assert generate_json_schema_block(BaseModel) == []
+
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+        assert any("JSON schema" in r.getMessage() for r in caplog.records)